@@ -26,6 +26,14 @@ def custom_encoder(obj):
     return str(obj)
 
 
+# Request kwargs as JSON for error logs, without headers (they carry the bearer token)
+def _loggable_kwargs(kwargs):
+    return json.dumps(
+        {key: value for key, value in kwargs.items() if key != "headers"},
+        default=custom_encoder,
+    )
+
+
 # Define a decorator to log the specified information for both sync and async functions
 def log_function_info(func):
     @functools.wraps(func)
@@ -1311,16 +1319,20 @@ class ApiClient(ApiClientBase):
 
 
 class AsyncApiClient(ApiClientBase):
-    def __init__(self, base_url, api_key):
+    def __init__(self, base_url, api_key, connector_limit=None):
         super().__init__(base_url, api_key)
         self.set_async(True)
+        self.connector_limit = connector_limit
         self._session = None
 
     async def initialize(self):
         """Initialize the client session"""
         if self._session is None:
+            connector = (
+                aiohttp.TCPConnector(limit=self.connector_limit) if self.connector_limit else None
+            )
             self._session = aiohttp.ClientSession(
-                headers={"Authorization": f"Bearer {self.api_key}"}
+                headers={"Authorization": f"Bearer {self.api_key}"}, connector=connector
             )
 
     async def close(self):
@@ -1338,23 +1350,33 @@ class AsyncApiClient(ApiClientBase):
                 content_type = response.headers.get("content-type", "")
                 if "application/json" not in content_type:
                     text = await response.text()
-                    logger.error(f"Unexpected content type: {content_type}, Response: {text}")
-                    return None
+                    error_message = f"Unexpected content type: {content_type}, Response: {text}"
+                    logger.error(error_message)
+                    return {"error": error_message}
             except Exception as e:
-                logger.error("HTTP Error: %s, kwargs: %s", str(e), json.dumps(kwargs))
-                return None
+                error_message = f"HTTP Error: {str(e)}"
+                try:
+                    error_detail = await response.text()
+                    error_message += f", Response: {error_detail}"
+                except Exception:
+                    pass
+                logger.error("%s, kwargs: %s", error_message, _loggable_kwargs(kwargs))
+                return {"error": error_message}
 
             try:
                 response_json = await response.json()
             except ValueError as e:
                 logger.error("Invalid JSON: %s", str(e))
-                return None
+                return {"error": f"Invalid JSON: {str(e)}"}
 
             if response_json.get("Errors") and len(response_json["Errors"]) > 0:
                 errors = response_json["Errors"]
                 error_messages = [error["Message"] for error in errors]
                 logger.error(
-                    "API Errors: %s, kwargs: %s", "\n".join(error_messages), json.dumps(kwargs)
+                    "API Errors: %s, kwargs: %s",
+                    "\n".join(error_messages),
+                    _loggable_kwargs(kwargs),
                 )
+                return {"error": f"API Errors: {', '.join(error_messages)}"}
 
             return response_json
@@ -1556,7 +1556,6 @@ class ScheduleManager:
                 .fillna(schedules_df["AbsenceName"])
                 .fillna(schedules_df["DayOffName"])
             )
-            schedules_df["Shift"] = schedules_df["Shift"]
 
             org_info_df = self.people_df[
                 [
@@ -1569,8 +1568,8 @@ class ScheduleManager:
             ]
             schedules_df = schedules_df.merge(org_info_df, on="PersonId", how="left")
 
-            schedules_df = schedules_df[
-                [
+            schedules_df = schedules_df.reindex(
+                columns=[
                     "BusinessUnitName",
                     "TeamName",
                     "Date",
@@ -1587,9 +1586,10 @@ class ScheduleManager:
                     "DayOffName",
                     "AbsenceName",
                     "Shift",
-                ]
-            ]
-            schedules_df = schedules_df[~schedules_df["Name"].isna()]
+                ],
+                copy=False,
+            )
+            schedules_df.dropna(subset=["Name"], inplace=True)
             if not with_ids:
                 schedules_df.drop(columns=["PersonId", "ShiftCategoryId"], inplace=True)
 
@@ -1,14 +1,192 @@
 """API upload functionality."""
 
+import asyncio
+import concurrent.futures
 import json
 import os
-from datetime import datetime
+import threading
+import time
+from datetime import datetime, timedelta
 from pathlib import Path
 
-from calabrio_py.calabrio_api import ApiClient
+from calabrio_py.calabrio_api import AsyncApiClient
 from dash import Input, Output, State, callback_context, html, no_update
 from validation_config import UPLOAD_LOG_DIR, ensure_directories
 
+try:
+    import orjson
+except ImportError:  # orjson is optional; fall back to the stdlib encoder
+    orjson = None
+
+
+# Uploads kept in flight at once unless CALABRIO_UPLOAD_CONCURRENCY is set
+DEFAULT_UPLOAD_CONCURRENCY = 32
+
+# How long the callback waits for a batch of uploads before giving up
+UPLOAD_TIMEOUT_SECONDS = 30 * 60
+
+
+# Uploads run on one long-lived event loop so the shared clients' aiohttp
+# sessions (and their pooled connections) survive across callbacks
+_loop = None
+_clients = {}
+_lock = threading.Lock()
+
+
+def _get_loop():
+    """Return the background upload event loop, starting it on first use."""
+    global _loop
+    with _lock:
+        if _loop is None:
+            _loop = asyncio.new_event_loop()
+            threading.Thread(target=_loop.run_forever, daemon=True).start()
+    return _loop
+
+
+def _get_client(base_url, api_key, concurrency):
+    """Return the shared AsyncApiClient for these settings, creating it on first use."""
+    key = (base_url, api_key, concurrency)
+    with _lock:
+        if key not in _clients:
+            _clients[key] = AsyncApiClient(base_url, api_key, connector_limit=concurrency)
+        return _clients[key]
+
+
+def _upload_concurrency():
+    """
+    Read CALABRIO_UPLOAD_CONCURRENCY, clamped to at least 1.
+
+    Raises:
+        ValueError: If the variable is set but is not an integer
+    """
+    value = os.environ.get("CALABRIO_UPLOAD_CONCURRENCY", "").strip()
+    if not value:
+        return DEFAULT_UPLOAD_CONCURRENCY
+    try:
+        return max(1, int(value))
+    except ValueError:
+        raise ValueError(f"CALABRIO_UPLOAD_CONCURRENCY must be an integer, got {value!r}") from None
+
+
+def _dumps_log_entry(log_entry):
+    """Serialize a log entry to a JSON line as bytes."""
+    if orjson is not None:
+        return orjson.dumps(log_entry, default=str) + b"\n"
+    return (json.dumps(log_entry, default=str) + "\n").encode("utf-8")
+
+
+def _to_int(value):
+    """Convert an upload grid value to int, treating blank strings as 0."""
+    if isinstance(value, str) and value.strip() == "":
+        value = 0
+    return int(float(value))
+
+
+async def _upload_one(client, row):
+    """Upload a single row to Calabrio and return its log entry."""
+    person_id = row.get("PersonId", "")
+    absence_id = row.get("AbsenceId", "")
+    date_from = row.get("StartDate", "")
+    balance_in = accrued = extra = None
+
+    try:
+        # Properly handle numbers
+        balance_in = _to_int(row.get("BalanceIn", ""))
+        accrued = _to_int(row.get("Accrued", ""))
+        extra = _to_int(row.get("Extra", ""))
+
+        # Uploading using production API
+        result = await client.add_or_update_person_account_for_person(
+            person_id=person_id,
+            absence_id=absence_id,
+            date_from=date_from,
+            balance_in=balance_in,
+            accrued=accrued,
+            extra=extra,
+        )
+
+        # Recording results
+        return {
+            "timestamp": time.monotonic(),
+            "person_id": person_id,
+            "absence_id": absence_id,
+            "date_from": date_from,
+            "balance_in": balance_in,
+            "accrued": accrued,
+            "extra": extra,
+            "success": True if not result.get("error") else False,
+            "message": "Successfully uploaded" if not result.get("error") else "",
+            "error": result.get("error", ""),
+            "api_response": result,
+        }
+
+    except Exception as e:
+        # Recording error
+        return {
+            "timestamp": time.monotonic(),
+            "person_id": person_id,
+            "absence_id": absence_id,
+            "date_from": date_from,
+            "balance_in": balance_in,
+            "accrued": accrued,
+            "extra": extra,
+            "success": False,
+            "message": "",
+            "error": str(e),
+        }
+
+
+def _cancelled_entry(row, timeout):
+    """Log entry for an upload cancelled at the timeout; it may still have reached the API."""
+    return {
+        "timestamp": time.monotonic(),
+        "person_id": row.get("PersonId", ""),
+        "absence_id": row.get("AbsenceId", ""),
+        "date_from": row.get("StartDate", ""),
+        "balance_in": None,
+        "accrued": None,
+        "extra": None,
+        "success": False,
+        "cancelled": True,
+        "message": "",
+        "error": f"Cancelled after {timeout} seconds; the record may have been uploaded",
+    }
+
+
+async def _upload_all(client, rows, concurrency, timeout=None):
+    """
+    Upload all rows concurrently and return their log entries in row order.
+
+    Uploads still running after timeout seconds are cancelled and logged
+    with "cancelled": True, so finished uploads are never lost from the log.
+    """
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def _bounded_upload(row):
+        async with semaphore:
+            return await _upload_one(client, row)
+
+    start_wall = datetime.now()
+    start_mono = time.monotonic()
+
+    # _upload_one records failures in its log entry, so tasks never raise
+    tasks = [asyncio.ensure_future(_bounded_upload(row)) for row in rows]
+    if tasks:
+        await asyncio.wait(tasks, timeout=timeout)
+    for task in tasks:
+        if not task.done():
+            task.cancel()
+    log_entries = [
+        task.result() if task.done() and not task.cancelled() else _cancelled_entry(row, timeout)
+        for task, row in zip(tasks, rows)
+    ]
+
+    # Entries carry a monotonic clock reading; convert to wall-clock ISO once at the end
+    for entry in log_entries:
+        offset = timedelta(seconds=entry["timestamp"] - start_mono)
+        entry["timestamp"] = (start_wall + offset).isoformat()
+    return log_entries
+
 
 def register_api_callbacks(app):
     """Register API upload callbacks."""
@@ -63,94 +241,65 @@ def register_api_callbacks(app):
                 "",
             )
 
-        client = ApiClient(base_url, api_key)
+        # Number of uploads kept in flight at once
+        try:
+            concurrency = _upload_concurrency()
+        except ValueError as e:
+            return (
+                html.Div([html.H4("Error", className="text-danger"), html.P(str(e))]),
+                False,
+                0,
+                "",
+            )
+        client = _get_client(base_url, api_key, concurrency)
 
         # Upload process
-        success_count = 0
-        error_count = 0
-
         # Preparing log file
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         ensure_directories()  # Creating necessary directories
         log_filename = UPLOAD_LOG_DIR / f"upload_log_{timestamp}.txt"
 
-        with open(log_filename, "w") as log_file:
-            # Processing each row
-            for i, row in enumerate(valid_rows):
-                person_id = row.get("PersonId", "")
-                absence_id = row.get("AbsenceId", "")
-                date_from = row.get("StartDate", "")
-
-                try:
-                    # Properly handle numbers
-                    balance_in = row.get("BalanceIn", "")
-                    if isinstance(balance_in, str) and balance_in.strip() == "":
-                        balance_in = 0
-                    balance_in = int(float(balance_in))
-
-                    accrued = row.get("Accrued", "")
-                    if isinstance(accrued, str) and accrued.strip() == "":
-                        accrued = 0
-                    accrued = int(float(accrued))
-
-                    extra = row.get("Extra", "")
-                    if isinstance(extra, str) and extra.strip() == "":
-                        extra = 0
-                    extra = int(float(extra))
-
-                    # Uploading using production API
-                    result = client.add_or_update_person_account_for_person(
-                        person_id=person_id,
-                        absence_id=absence_id,
-                        date_from=date_from,
-                        balance_in=balance_in,
-                        accrued=accrued,
-                        extra=extra,
-                    )
-
-                    # Recording results
-                    log_entry = {
-                        "timestamp": datetime.now().isoformat(),
-                        "person_id": person_id,
-                        "absence_id": absence_id,
-                        "date_from": date_from,
-                        "balance_in": balance_in,
-                        "accrued": accrued,
-                        "extra": extra,
-                        "success": True if not result.get("error") else False,
-                        "message": "Successfully uploaded" if not result.get("error") else "",
-                        "error": result.get("error", ""),
-                        "api_response": result,
-                    }
-
-                    log_file.write(json.dumps(log_entry) + "\n")
-
-                    if not result.get("error"):
-                        success_count += 1
-                    else:
-                        error_count += 1
-
-                except Exception as e:
-                    # Recording error
-                    error_message = str(e)
-                    log_entry = {
-                        "timestamp": datetime.now().isoformat(),
-                        "person_id": person_id,
-                        "absence_id": absence_id,
-                        "date_from": date_from,
-                        "balance_in": balance_in if "balance_in" in locals() else None,
-                        "accrued": accrued if "accrued" in locals() else None,
-                        "extra": extra if "extra" in locals() else None,
-                        "success": False,
-                        "message": "",
-                        "error": error_message,
-                    }
-
-                    log_file.write(json.dumps(log_entry) + "\n")
-                    error_count += 1
+        # Uploads run on the shared event loop; log entries are written once at the end.
+        # _upload_all stops at UPLOAD_TIMEOUT_SECONDS itself and returns partial results,
+        # the extra minute only guards against the loop itself being stuck.
+        future = asyncio.run_coroutine_threadsafe(
+            _upload_all(client, valid_rows, concurrency, UPLOAD_TIMEOUT_SECONDS), _get_loop()
+        )
+        try:
+            log_entries = future.result(timeout=UPLOAD_TIMEOUT_SECONDS + 60)
+        except concurrent.futures.TimeoutError:
+            future.cancel()
+            return (
+                html.Div(
+                    [
+                        html.H4("Error", className="text-danger"),
+                        html.P(
+                            f"Upload did not finish within {UPLOAD_TIMEOUT_SECONDS} seconds "
+                            "and was cancelled. Some records may already have been uploaded."
+                        ),
+                    ]
+                ),
+                False,
+                0,
+                "",
+            )
+
+        log_filename.write_bytes(b"".join(_dumps_log_entry(entry) for entry in log_entries))
+
+        success_count = sum(1 for entry in log_entries if entry["success"])
+        cancelled_count = sum(1 for entry in log_entries if entry.get("cancelled"))
+        error_count = len(log_entries) - success_count - cancelled_count
 
         # Displaying final results
-        if error_count == 0:
+        if cancelled_count:
+            result_color = "danger"
+            icon = "❌"
+            message = (
+                f"Upload did not finish within {UPLOAD_TIMEOUT_SECONDS} seconds: "
+                f"{success_count} uploads succeeded and {error_count} failed before the cutoff, "
+                f"{cancelled_count} were cancelled and may or may not have been applied."
+            )
+        elif error_count == 0:
             result_color = "success"
             icon = "✓"
             message = f"All records ({success_count}) successfully uploaded."
@@ -180,5 +329,6 @@ def register_api_callbacks(app):
             final_result,
             True,
             100,
-            f"Completed - Success: {success_count}, Failed: {error_count}",
+            f"Completed - Success: {success_count}, Failed: {error_count}"
+            + (f", Cancelled: {cancelled_count}" if cancelled_count else ""),
         )
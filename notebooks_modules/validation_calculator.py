@@ -1,29 +1,128 @@
 import json
 import math
+import os
+import re
 from datetime import date, datetime
+from functools import lru_cache
+from types import MappingProxyType
 
+import numpy as np
 import pandas as pd
 
 
+_ISO_DATE_RE = re.compile(r"^\d{4}-\d{2}-\d{2}")
+
+
+def _parse_date(value):
+    """Parse a date value, skipping pandas for plain ISO date strings."""
+    if isinstance(value, str) and _ISO_DATE_RE.match(value):
+        try:
+            return datetime.fromisoformat(value[:10])
+        except ValueError:
+            pass
+    return pd.to_datetime(value, errors="coerce")
+
+
+def _freeze(value):
+    """Recursively convert dicts and lists into read-only equivalents."""
+    if isinstance(value, dict):
+        return MappingProxyType({key: _freeze(item) for key, item in value.items()})
+    if isinstance(value, list):
+        return tuple(_freeze(item) for item in value)
+    return value
+
+
+def _normalize_condition_value(value):
+    """Normalize a condition or row value for case-insensitive comparison."""
+    return str(value).strip().upper()
+
+
+def _prepare_rule(rule):
+    """Attach pre-normalized (key, value) condition pairs to a rule."""
+    rule = dict(rule)
+    rule["_normalized_conditions"] = tuple(
+        (key, _normalize_condition_value(value))
+        for key, value in rule.get("conditions", {}).items()
+    )
+    return _freeze(rule)
+
+
+@lru_cache(maxsize=8)
+def _load_rules_cached(rules_path, mtime):
+    """
+    Load rules from a JSON file, sorted by priority, with an AbsenceType index.
+
+    The cache is keyed on the file's modification time, so editing the rules
+    file invalidates it. Rules are returned frozen because they are shared.
+    The index maps each normalized AbsenceType to every rule that could match
+    it (its own rules plus those without an AbsenceType condition), in
+    priority order; the ungated rules alone are stored under "".
+    """
+    with open(rules_path, "r") as f:
+        rules = json.load(f)["rules"]
+    # Sort rules by priority
+    rules = tuple(
+        _prepare_rule(rule) for rule in sorted(rules, key=lambda x: x.get("priority", 999))
+    )
+
+    rules_by_absence = {}
+    for index, rule in enumerate(rules):
+        absence_type = _normalize_condition_value(rule["conditions"].get("AbsenceType", ""))
+        rules_by_absence.setdefault(absence_type, []).append(index)
+
+    ungated = rules_by_absence.get("", [])
+    candidates_by_absence = {}
+    for absence_type, indices in rules_by_absence.items():
+        if absence_type:
+            indices = sorted(indices + ungated)
+        candidates_by_absence[absence_type] = tuple(rules[index] for index in indices)
+
+    return rules, MappingProxyType(candidates_by_absence)
+
+
+@lru_cache(maxsize=1024)
+def _proration_ratio(year_start_date, current_year):
+    """Share of current_year remaining from year_start_date, by days."""
+    year_end = date(current_year, 12, 31)
+    total_days = (year_end - date(current_year, 1, 1)).days + 1
+    remaining_days = (year_end - year_start_date).days + 1
+    return remaining_days / total_days
+
+
+@lru_cache(maxsize=1024)
+def _week_proration_ratio(year_start_date):
+    """Share of the 52-week year remaining from year_start_date's ISO week."""
+    join_week = year_start_date.isocalendar()[1]
+    remaining_weeks = max(52 - join_week + 1, 0)
+    return remaining_weeks / 52
+
+
 class BalanceCalculator:
     """Calculates correct balance and accrual based on rules."""
 
     def __init__(self, rules_path):
-        self.rules = self._load_rules(rules_path)
+        self.rules, self._rules_by_absence = self._load_rules(rules_path)
+        self.current_year = datetime.now().year
 
     def _load_rules(self, rules_path):
-        """Load rules from a JSON file."""
+        """Load rules and their AbsenceType index from a JSON file."""
         try:
-            with open(rules_path, "r") as f:
-                rules = json.load(f)["rules"]
-                # Sort rules by priority
-                return sorted(rules, key=lambda x: x.get("priority", 999))
+            return _load_rules_cached(str(rules_path), os.path.getmtime(rules_path))
         except (FileNotFoundError, json.JSONDecodeError) as e:
             print(f"Error loading rules from {rules_path}: {e}")
-            return []
+            return (), MappingProxyType({})
         except KeyError as e:
             print(f"Error: 'rules' key not found in {rules_path}: {e}")
-            return []
+            return (), MappingProxyType({})
+
+    def _candidate_rules(self, row):
+        """Return the rules that could match a row, in priority order."""
+        absence_type = _normalize_condition_value(row.get("AbsenceType", ""))
+        candidates = self._rules_by_absence.get(absence_type)
+        if candidates is None:
+            # No rule is gated on this AbsenceType, only the ungated ones can match
+            candidates = self._rules_by_absence.get("", ())
+        return candidates
 
     def _get_year_start_date(self, row):
         """
@@ -33,7 +132,7 @@ class BalanceCalculator:
         - If hired before 2025: use January 1st, 2025
         - If hired in 2025: use actual hire date
         """
-        current_year = datetime.now().year
+        current_year = self.current_year
         default_start = date(current_year, 1, 1)
 
         try:
@@ -53,7 +152,7 @@ class BalanceCalculator:
                     if "T" in hire_date_str:
                         hire_date_str = hire_date_str.split("T")[0]
 
-                hire_date = pd.to_datetime(hire_date_str, errors="coerce")
+                hire_date = _parse_date(hire_date_str)
                 if pd.isna(hire_date):
                     return default_start
             except Exception:
@@ -96,23 +195,16 @@ class BalanceCalculator:
         if not year_start_date:
             return 0
 
-        current_year = datetime.now().year
-        year_end = date(current_year, 12, 31)
-        total_days = (date(current_year, 12, 31) - date(current_year, 1, 1)).days + 1
-        remaining_days = (year_end - year_start_date).days + 1
-
-        return remaining_days / total_days
+        return _proration_ratio(year_start_date, self.current_year)
 
     def _calculate_week_proration_ratio(self, year_start_date):
         """Calculate week-based proration ratio based on YearStartDate."""
         if not year_start_date:
             return 0
         try:
-            join_week = year_start_date.isocalendar()[1]
+            return _week_proration_ratio(year_start_date)
         except Exception:
             return 0
-        remaining_weeks = max(52 - join_week + 1, 0)
-        return remaining_weeks / 52
 
     def _calculate_me_day_balance(self, year_start_date, is_usa=False):
         """Calculate Me Day balance based on remaining quarters."""
@@ -128,16 +220,20 @@ class BalanceCalculator:
             # Global: 1 day per quarter
             return remaining_quarters
 
-    def _conditions_met(self, row, conditions):
-        """Check if all conditions in a rule are met."""
-        for condition_key, condition_value in conditions.items():
-            row_value = str(row.get(condition_key, "")).strip().upper()
-            condition_value = str(condition_value).strip().upper()
-
-            if row_value != condition_value:
+    def _conditions_met(self, row, normalized_conditions):
+        """Check if all pre-normalized conditions in a rule are met."""
+        for condition_key, condition_value in normalized_conditions:
+            if _normalize_condition_value(row.get(condition_key, "")) != condition_value:
                 return False
         return True
 
+    def _match_rule(self, row):
+        """Return the highest-priority rule whose conditions the row meets, or None."""
+        for rule in self._candidate_rules(row):
+            if self._conditions_met(row, rule["_normalized_conditions"]):
+                return rule
+        return None
+
     def _calculate_accrual(self, rule, year_start_date):
         """Calculate accrual based on rule type."""
         accrual_type = rule.get("accrual_calculation")
@@ -184,27 +280,25 @@ class BalanceCalculator:
         if normalized_absence.startswith("usa -"):
             balance = balance * 60
 
-        # Find the first matching rule for accrual calculation
-        for rule in self.rules:
-            # Use a temporary dict with the original absence type if provided
-            if original_absence_type is not None:
-                temp_row = {"AbsenceType": original_absence_type}
-            else:
-                temp_row = row
-
-            rule_conditions = rule["conditions"]
+        # Use a temporary dict with the original absence type if provided
+        if original_absence_type is not None:
+            temp_row = {"AbsenceType": original_absence_type}
+        else:
+            temp_row = row
 
-            if self._conditions_met(temp_row, rule_conditions):
-                accrual = self._calculate_accrual(rule, year_start_date)
+        # Find the first matching rule for accrual calculation
+        rule = self._match_rule(temp_row)
+        if rule is not None:
+            accrual = self._calculate_accrual(rule, year_start_date)
 
-                # Special cases
-                if normalized_absence == "est - vacation plan (days)":
-                    balance = max(0, balance)  # Clip negative balance to 0
+            # Special cases
+            if normalized_absence == "est - vacation plan (days)":
+                balance = max(0, balance)  # Clip negative balance to 0
 
-                # Round the balance after all calculations
-                balance = round(balance)
+            # Round the balance after all calculations
+            balance = round(balance)
 
-                return balance, accrual
+            return balance, accrual
 
         # If no rule matches, return Workday values
         accrual = row.get("Accrued this year", 0)
@@ -212,3 +306,124 @@ class BalanceCalculator:
         balance = round(balance)
 
         return balance, accrual
+
+    def _get_year_start_dates(self, df):
+        """Vectorized _get_year_start_date over a DataFrame."""
+        current_year = self.current_year
+        default_start = pd.Timestamp(current_year, 1, 1)
+        missing = pd.Series(pd.NaT, index=df.index)
+
+        # Fall back to EmploymentStartDate where Latest Headcount Hire Date is missing
+        hire_dates = df.get("Latest Headcount Hire Date", missing)
+        employment_dates = df.get("EmploymentStartDate", missing)
+        hire_missing = hire_dates.isna() | hire_dates.isin(["", "N/A"])
+        hire_dates = hire_dates.where(~hire_missing, employment_dates)
+
+        if hire_dates.dtype == object:
+            # Handle ISO format with T separator
+            hire_dates = hire_dates.map(lambda x: x.split("T")[0] if isinstance(x, str) else x)
+            hire_dates = hire_dates.where(~hire_dates.isin(["", "N/A"]))
+
+        hire_dates = pd.to_datetime(hire_dates, errors="coerce", format="mixed").dt.normalize()
+
+        # Only hire dates in the current year move the start date
+        return hire_dates.where(hire_dates.dt.year == current_year, default_start)
+
+    def _calculate_accrual_array(self, rule, year_start_dates):
+        """Vectorized _calculate_accrual for rows sharing the same rule."""
+        accrual_type = rule.get("accrual_calculation")
+        default_accrual = rule.get("default_accrual", 0)
+
+        if accrual_type == "fixed":
+            return np.full(len(year_start_dates), default_accrual, dtype=np.float64)
+
+        if accrual_type == "prorate":
+            if default_accrual in (12000, 7200):  # USA - PTO and USA - Sickness
+                join_weeks = year_start_dates.dt.isocalendar().week.to_numpy(dtype=np.int64)
+                ratio = np.maximum(52 - join_weeks + 1, 0) / 52
+            else:
+                current_year = self.current_year
+                total_days = (date(current_year, 12, 31) - date(current_year, 1, 1)).days + 1
+                year_end = pd.Timestamp(current_year, 12, 31)
+                remaining_days = (year_end - year_start_dates).dt.days.to_numpy() + 1
+                ratio = remaining_days / total_days
+            return np.floor(default_accrual * ratio)
+
+        if accrual_type in ("me_day_global", "me_day_usa"):
+            quarters = np.ceil(year_start_dates.dt.month.to_numpy() / 3)
+            remaining_quarters = np.maximum(4 - quarters, 0)
+            # USA: 480 minutes (8 hours) per quarter, Global: 1 day per quarter
+            return remaining_quarters * (480 if accrual_type == "me_day_usa" else 1)
+
+        return np.zeros(len(year_start_dates), dtype=np.float64)
+
+    def _balance_inputs(self, df, absence_type_column):
+        """Return the normalized absence types and the balance in minutes for df."""
+        balance = (
+            pd.to_numeric(df.get("Beginning Year Balance", 0), errors="coerce")
+            .reindex(df.index)
+            .fillna(0)
+            .astype(np.float64)
+        )
+        normalized_absence = (
+            df[absence_type_column].astype(object).astype(str).str.lower().str.strip()
+        )
+
+        # Convert Workday balance (hours) to minutes for USA Absence Types
+        balance = balance.where(~normalized_absence.str.startswith("usa -"), balance * 60)
+        return normalized_absence, balance
+
+    def calculate_correct_values_df(self, df, absence_type_column="AbsenceType"):
+        """
+        Calculate correct balance and accrual for every row of a DataFrame.
+
+        Equivalent to calling calculate_correct_values(row, row[absence_type_column])
+        for each row, but evaluated column-wise. Rule matching runs once per
+        distinct absence type instead of once per row.
+
+        Returns:
+            tuple: (balance Series, accrual Series) aligned with df.index
+        """
+        normalized_absence, balance = self._balance_inputs(df, absence_type_column)
+        balance = balance.to_numpy()
+        absence_types = df[absence_type_column].astype(object)
+
+        # Resolve the matching rule once per distinct absence type
+        codes, uniques = pd.factorize(absence_types, use_na_sentinel=False)
+        rule_positions = {id(rule): position for position, rule in enumerate(self.rules)}
+        unique_rule_positions = np.array(
+            [
+                rule_positions.get(id(self._match_rule({"AbsenceType": value})), -1)
+                for value in uniques
+            ],
+            dtype=np.int64,
+        )
+        row_rule_positions = unique_rule_positions[codes]
+        matched = row_rule_positions >= 0
+
+        # If no rule matches, use the Workday accrual
+        accrual = (
+            pd.to_numeric(df.get("Accrued this year", 0), errors="coerce")
+            .reindex(df.index)
+            .fillna(0)
+            .to_numpy(dtype=np.float64)
+        )
+        accrual = np.round(accrual)
+
+        if matched.any():
+            year_start_dates = self._get_year_start_dates(df)
+            for position in np.unique(row_rule_positions[matched]):
+                mask = row_rule_positions == position
+                accrual[mask] = self._calculate_accrual_array(
+                    self.rules[position], year_start_dates[mask]
+                )
+
+        # Special cases: clip negative balance to 0
+        clip = matched & (normalized_absence == "est - vacation plan (days)").to_numpy()
+        balance = np.where(clip, np.maximum(balance, 0), balance)
+
+        # Round the balance after all calculations
+        balance = pd.Series(np.round(balance).astype(np.int64), index=df.index)
+        if np.array_equal(accrual, np.round(accrual)):
+            accrual = accrual.astype(np.int64)
+        return balance, pd.Series(accrual, index=df.index)
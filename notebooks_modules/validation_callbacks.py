@@ -6,25 +6,41 @@ from validation_calculator import BalanceCalculator
 from validation_config import (
     CALABRIO_DIR,
     CONFIG_DATA_PATH,
+    ROW_ID_COLUMN,
     WORKDAY_DIR,
     get_calabrio_file,
     get_config_file,
     get_workday_file,
 )
+from validation_utils import filter_validation_data as filter_rows
 from validation_utils import (
+    categorize_filter_columns,
     convert_to_upload_format,
     create_filter_options,
-    filter_validation_data,
+    records_json,
     safe_get_column,
 )
 
+# Validation grid column -> (upload grid column, default when missing)
+UPLOAD_COLUMNS = {
+    "Workday Person Number": ("EmploymentNumber", ""),
+    "StartDate": ("StartDate", ""),
+    "Calabrio PersonId": ("PersonId", ""),
+    "Absence ID": ("AbsenceId", ""),
+    "Correct Balance In": ("BalanceIn", 0),
+    "Correct_Accrued": ("Accrued", 0),
+    "Calabrio Extra": ("Extra", 0),
+}
+
 
 def register_callbacks(app, validation_df):
     """Register all callbacks for the validation app."""
+    # Categorical filter columns make the repeated isin filtering cheap
+    validation_df = categorize_filter_columns(validation_df)
 
     # Filtering Callback
     @app.callback(
-        Output("validation-grid", "rowData"),
+        Output("validation-filter-store", "data"),
         [Input("apply-filters-button", "n_clicks"), Input("clear-filters-button", "n_clicks")],
         [
             State("absence-type-filter", "value"),
@@ -32,34 +48,61 @@ def register_callbacks(app, validation_df):
             State("balance-match-filter", "value"),
             State("accrual-match-filter", "value"),
         ],
+        prevent_initial_call=True,
     )
     def filter_validation_data(
         apply_clicks, clear_clicks, absence_types, contracts, balance_matches, accrual_matches
     ):
-        ctx = callback_context
-        if not ctx.triggered:
-            return validation_df.to_dict("records")
-
-        button_id = ctx.triggered[0]["prop_id"].split(".")[0]
+        button_id = callback_context.triggered[0]["prop_id"].split(".")[0]
 
         if button_id == "clear-filters-button":
-            return validation_df.to_dict("records")
+            return {}
 
-        df = validation_df.copy()
+        return {
+            "absence_types": absence_types,
+            "contracts": contracts,
+            "balance_matches": balance_matches,
+            "accrual_matches": accrual_matches,
+        }
 
-        if absence_types:
-            df = df[df["Workday Absence Type"].isin(absence_types)]
+    # Drop the grid's cached blocks so it requests rows again with the new filters
+    app.clientside_callback(
+        """
+        function(filters) {
+            dash_ag_grid.getApiAsync("validation-grid").then((api) => api.purgeInfiniteCache());
+            return window.dash_clientside.no_update;
+        }
+        """,
+        Output("validation-grid-refresh", "children"),
+        Input("validation-filter-store", "data"),
+        prevent_initial_call=True,
+    )
 
-        if contracts:
-            df = df[df["ContractName"].isin(contracts)]
+    # Rows Callback (infinite row model)
+    @app.callback(
+        Output("validation-grid", "getRowsResponse"),
+        Input("validation-grid", "getRowsRequest"),
+        State("validation-filter-store", "data"),
+    )
+    def get_validation_rows(request, filters):
+        if not request:
+            return no_update
 
-        if balance_matches:
-            df = df[df["Balance Match"].isin(balance_matches)]
+        df = filter_rows(validation_df, **(filters or {}))
 
-        if accrual_matches:
-            df = df[df["Accrual Match"].isin(accrual_matches)]
+        # Column ids come from the browser; ignore any the table does not have.
+        # filterModel is ignored: the grid has no column filters, only the panel above it.
+        sort_model = [sort for sort in request.get("sortModel") or [] if sort["colId"] in df]
+        if sort_model:
+            df = df.sort_values(
+                by=[sort["colId"] for sort in sort_model],
+                ascending=[sort["sort"] == "asc" for sort in sort_model],
+            )
 
-        return df.to_dict("records")
+        # ROW_ID_COLUMN carries the table index so getRowId stays unique across filters
+        rows = df.iloc[request["startRow"] : request["endRow"]]
+        rows = rows.assign(**{ROW_ID_COLUMN: rows.index})
+        return {"rowData": records_json(rows), "rowCount": len(df)}
 
     # Data Transfer Callback
     @app.callback(
@@ -77,19 +120,14 @@ def register_callbacks(app, validation_df):
         if not callback_context.triggered or not selected_rows:
             return [], "validation", "", False, ""
 
-        # Convert selected rows to upload format
-        upload_rows = []
-        for row in selected_rows:
-            upload_row = {
-                "EmploymentNumber": row.get("Workday Person Number", ""),
-                "StartDate": row.get("StartDate", ""),
-                "PersonId": row.get("Calabrio PersonId", ""),
-                "AbsenceId": row.get("Absence ID", ""),
-                "BalanceIn": row.get("Correct Balance In", 0),
-                "Accrued": row.get("Correct_Accrued", 0),
-                "Extra": row.get("Calabrio Extra", 0),
-            }
-            upload_rows.append(upload_row)
+        # Convert selected rows to upload format in one reshape
+        upload_df = (
+            pd.DataFrame(selected_rows, dtype=object)
+            .reindex(columns=list(UPLOAD_COLUMNS))
+            .rename(columns={src: dst for src, (dst, _) in UPLOAD_COLUMNS.items()})
+        )
+        defaults = pd.Series(dict(UPLOAD_COLUMNS.values()))
+        upload_rows = upload_df.mask(upload_df.isna(), defaults, axis="columns").to_dict("records")
 
         return (
             upload_rows,
@@ -136,21 +174,14 @@ def register_callbacks(app, validation_df):
         if not n_clicks or not selected_rows or not current_data:
             return no_update
 
-        # Get IDs of selected rows
-        selected_ids = set()
-        for row in selected_rows:
-            # Uniquely identify by combination of PersonId and AbsenceId
-            row_id = f"{row.get('PersonId', '')}_{row.get('AbsenceId', '')}"
-            selected_ids.add(row_id)
+        # Uniquely identify rows by the (PersonId, AbsenceId) pair
+        def row_key(row):
+            return row.get("PersonId", ""), row.get("AbsenceId", "")
 
-        # Exclude selected rows
-        new_data = []
-        for row in current_data:
-            row_id = f"{row.get('PersonId', '')}_{row.get('AbsenceId', '')}"
-            if row_id not in selected_ids:
-                new_data.append(row)
+        selected_ids = {row_key(row) for row in selected_rows}
 
-        return new_data
+        # Exclude selected rows
+        return [row for row in current_data if row_key(row) not in selected_ids]
 
     # Debug Output
     @app.callback(
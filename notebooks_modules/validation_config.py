@@ -26,10 +26,23 @@ BALANCE_RULES_PATH = CONFIG_DIR / "balance_rules.json"  # Added: Balance rules p
 # Log file settings
 UPLOAD_LOG_DIR = LOGS_DIR / "uploads"
 
+# Validation grid row field holding the table index, used by the grid's getRowId
+ROW_ID_COLUMN = "_row_id"
+
+
+# Set once ensure_directories has created everything successfully
+_ensured = False
+
 
 # Create each directory
 def ensure_directories():
-    """Create necessary directories."""
+    """Create necessary directories (only until one call has succeeded)."""
+    global _ensured
+    if _ensured:
+        return
+
+    ok = True
+
     # Creating base directories
     for directory in [DATA_DIR, CONFIG_DIR, LOGS_DIR]:
         try:
@@ -40,6 +53,7 @@ def ensure_directories():
                 directory.mkdir(parents=True, exist_ok=True)
         except Exception as e:
             print(f"Warning: Failed to create directory {directory}: {e}")
+            ok = False
 
     # Creating Workday directories
     for directory in [WORKDAY_DIR, PERSON_ACCOUNTS_DIR, PEOPLE_DIR, USED_ENTRIES_DIR]:
@@ -51,6 +65,7 @@ def ensure_directories():
                 directory.mkdir(parents=True, exist_ok=True)
         except Exception as e:
             print(f"Warning: Failed to create directory {directory}: {e}")
+            ok = False
 
     # Processing Calabrio directories
     try:
@@ -59,12 +74,16 @@ def ensure_directories():
             CONFIG_DATA_PATH.parent.mkdir(parents=True, exist_ok=True)
     except Exception as e:
         print(f"Warning: Failed to create Calabrio directory: {e}")
+        ok = False
 
     # Creating log directory
     try:
         UPLOAD_LOG_DIR.mkdir(parents=True, exist_ok=True)
     except Exception as e:
         print(f"Warning: Failed to create upload log directory: {e}")
+        ok = False
+
+    _ensured = ok
 
 
 # Functions to get data file paths
@@ -1,50 +1,152 @@
 import json
+import zlib
+from concurrent.futures import ThreadPoolExecutor, wait
 from pathlib import Path
 
 import pandas as pd
 
+try:
+    import orjson
+except ImportError:  # orjson is optional; fall back to the stdlib parser
+    orjson = None
+
+try:
+    import pyarrow  # noqa: F401
+
+    STRING_DTYPE = "string[pyarrow]"
+except ImportError:  # pyarrow is optional; keep plain object strings without it
+    STRING_DTYPE = str
+
+try:
+    import python_calamine  # noqa: F401
+
+    # pandas only has the calamine engine from 2.2 on
+    _PANDAS_VERSION = tuple(int(part) for part in pd.__version__.split(".")[:2])
+    EXCEL_ENGINE = "calamine" if _PANDAS_VERSION >= (2, 2) else "openpyxl"
+except ImportError:  # python-calamine is optional; openpyxl is always available
+    EXCEL_ENGINE = "openpyxl"
+
+
+# Only the columns the preprocessing merges pull from the lookup sources
+PEOPLE_USECOLS = [
+    "Latest Headcount Wiser ID",
+    "Latest Headcount Hire Date",
+    "Latest Headcount Primary Work Email",
+]
+PERSON_USECOLS = ["EmploymentNumber", "PersonId", "BusinessUnitName", "EmploymentStartDate"]
+
+# Parsed Excel files are cached here, outside the shared Workday data directories
+EXCEL_CACHE_DIR = Path(__file__).resolve().parent.parent / ".cache" / "excel"
+
+
+def _read_excel_cached(excel_file, skiprows, usecols=None):
+    """
+    Read an Excel file, caching the parsed frame as parquet in EXCEL_CACHE_DIR.
+
+    The cache file name records the source's size and nanosecond mtime, so
+    any replaced export misses the cache, even one copied with its mtime
+    preserved. Frames that cannot be written as parquet (e.g. mixed-type
+    columns) leave a marker file and are read from Excel without retrying the
+    write. Any other cache problem (e.g. pyarrow missing) falls back to Excel.
+    When usecols is given only those columns (where present) are parsed.
+    """
+    stat = excel_file.stat()
+    source_key = zlib.crc32(str(excel_file.resolve()).encode())
+    cache_prefix = f"{excel_file.stem}.{source_key:08x}.skip{skiprows}"
+    if usecols is not None:
+        cache_prefix += f".cols{zlib.crc32('|'.join(usecols).encode()):08x}"
+    cache_path = EXCEL_CACHE_DIR / f"{cache_prefix}.{stat.st_size}-{stat.st_mtime_ns}.parquet"
+    failed_marker = cache_path.with_suffix(".failed")
+
+    if cache_path.exists():
+        try:
+            return pd.read_parquet(cache_path)
+        except Exception as e:
+            print(f"Warning: Failed to read cache {cache_path}: {e}")
+
+    df = pd.read_excel(
+        excel_file,
+        skiprows=skiprows,
+        usecols=None if usecols is None else lambda col: col in usecols,
+        engine=EXCEL_ENGINE,
+    )
+    if failed_marker.exists():
+        return df
+
+    try:
+        EXCEL_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        # Caches of earlier versions of this export are never read again
+        for stale in EXCEL_CACHE_DIR.glob(f"{cache_prefix}.[0-9]*"):
+            stale.unlink()
+    except Exception as e:
+        print(f"Warning: Failed to prepare cache directory {EXCEL_CACHE_DIR}: {e}")
+        return df
+    try:
+        df.to_parquet(cache_path)
+    except Exception as e:
+        print(f"Warning: Failed to write cache {cache_path}, not caching this file: {e}")
+        cache_path.unlink(missing_ok=True)
+        failed_marker.touch()
+    return df
+
+
+def _process_wiser_id(df):
+    """Normalize the WiserId column of person accounts / used entries data."""
+    if "WiserId" in df.columns:
+        df["WiserId"] = df["WiserId"].astype(STRING_DTYPE)
+    return df
+
+
+def _process_people(df):
+    """Rename and convert the columns of people data."""
+    if "Latest Headcount Wiser ID" in df.columns:
+        df.rename(columns={"Latest Headcount Wiser ID": "WiserId"}, inplace=True)
+        df["WiserId"] = df["WiserId"].astype(STRING_DTYPE)
+    if "Latest Headcount Hire Date" in df.columns:
+        df["Latest Headcount Hire Date"] = pd.to_datetime(df["Latest Headcount Hire Date"])
+    return df
+
+
+def _load_xlsx(directory, skiprows, post_process_fn, usecols=None):
+    """Load the latest Excel file in a directory and post-process it."""
+    if not directory.exists():
+        return pd.DataFrame()
+
+    excel_files = list(directory.glob("*.xlsx"))
+    if not excel_files:
+        return pd.DataFrame()
+
+    latest_file = max(excel_files, key=lambda x: x.stat().st_mtime)
+    return post_process_fn(_read_excel_cached(latest_file, skiprows=skiprows, usecols=usecols))
+
 
 def load_workday_data(PERSON_ACCOUNTS_DIR, PEOPLE_DIR, USED_ENTRIES_DIR):
     """Load all Workday data files."""
-    workday_df = pd.DataFrame()
-    people_df = pd.DataFrame()
-    used_entries_df = pd.DataFrame()
-
-    # Load person_accounts data
-    if PERSON_ACCOUNTS_DIR.exists():
-        excel_files = list(PERSON_ACCOUNTS_DIR.glob("*.xlsx"))
-        if excel_files:
-            latest_file = max(excel_files, key=lambda x: x.stat().st_mtime)
-            workday_df = pd.read_excel(latest_file, skiprows=6, engine="openpyxl")
-            if "WiserId" in workday_df.columns:
-                workday_df["WiserId"] = workday_df["WiserId"].astype(str)
-
-    # Load people data
-    if PEOPLE_DIR.exists():
-        excel_files = list(PEOPLE_DIR.glob("*.xlsx"))
-        if excel_files:
-            latest_file = max(excel_files, key=lambda x: x.stat().st_mtime)
-            people_df = pd.read_excel(latest_file, skiprows=2, engine="openpyxl")
-            if "Latest Headcount Wiser ID" in people_df.columns:
-                people_df.rename(columns={"Latest Headcount Wiser ID": "WiserId"}, inplace=True)
-                people_df["WiserId"] = people_df["WiserId"].astype(str)
-            if "Latest Headcount Hire Date" in people_df.columns:
-                people_df["Latest Headcount Hire Date"] = pd.to_datetime(
-                    people_df["Latest Headcount Hire Date"]
-                )
-
-    # Load used entries data
-    if USED_ENTRIES_DIR.exists():
-        excel_files = list(USED_ENTRIES_DIR.glob("*.xlsx"))
-        if excel_files:
-            latest_file = max(excel_files, key=lambda x: x.stat().st_mtime)
-            used_entries_df = pd.read_excel(latest_file, skiprows=6, engine="openpyxl")
-            if "WiserId" in used_entries_df.columns:
-                used_entries_df["WiserId"] = used_entries_df["WiserId"].astype(str)
+    # The three files are independent, so parse them concurrently
+    with ThreadPoolExecutor(max_workers=3) as executor:
+        futures = [
+            executor.submit(_load_xlsx, PERSON_ACCOUNTS_DIR, 6, _process_wiser_id),
+            executor.submit(_load_xlsx, PEOPLE_DIR, 2, _process_people, PEOPLE_USECOLS),
+            executor.submit(_load_xlsx, USED_ENTRIES_DIR, 6, _process_wiser_id),
+        ]
+        wait(futures)
 
+    workday_df, people_df, used_entries_df = (future.result() for future in futures)
     return workday_df, people_df, used_entries_df
 
 
+def _load_json(path):
+    """Parse a JSON file, using orjson when it is installed."""
+    data = path.read_bytes()
+    if orjson is not None:
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            # Calabrio exports may contain bare NaN, which only json accepts
+            pass
+    return json.loads(data)
+
+
 def load_calabrio_data(ACCOUNT_DATA_PATH, PERSON_DATA_PATH):
     """Load all Calabrio data files."""
     calabrio_df = pd.DataFrame()
@@ -52,23 +154,23 @@ def load_calabrio_data(ACCOUNT_DATA_PATH, PERSON_DATA_PATH):
 
     # Load account data
     if ACCOUNT_DATA_PATH.exists():
-        with open(ACCOUNT_DATA_PATH, "r") as f:
-            json_data = json.load(f)
-            calabrio_df = pd.DataFrame(json_data)
-            if "EmploymentNumber" in calabrio_df.columns:
-                calabrio_df["EmploymentNumber"] = calabrio_df["EmploymentNumber"].astype(str)
-            if "Accrued" in calabrio_df.columns:
-                calabrio_df["Accrued"] = pd.to_numeric(
-                    calabrio_df["Accrued"], errors="coerce"
-                ).fillna(0)
+        calabrio_df = pd.DataFrame.from_records(_load_json(ACCOUNT_DATA_PATH))
+        if "EmploymentNumber" in calabrio_df.columns:
+            calabrio_df["EmploymentNumber"] = calabrio_df["EmploymentNumber"].astype(STRING_DTYPE)
+        if "Accrued" in calabrio_df.columns:
+            calabrio_df["Accrued"] = pd.to_numeric(
+                calabrio_df["Accrued"], errors="coerce"
+            ).fillna(0)
 
     # Load person data
     if PERSON_DATA_PATH.exists():
-        with open(PERSON_DATA_PATH, "r") as f:
-            json_data = json.load(f)
-            person_df = pd.DataFrame(json_data)
-            if "EmploymentNumber" in person_df.columns:
-                person_df["EmploymentNumber"] = person_df["EmploymentNumber"].astype(str)
-            person_df["EmploymentStartDate"] = pd.to_datetime(person_df["EmploymentStartDate"])
+        person_df = pd.DataFrame.from_records(
+            _load_json(PERSON_DATA_PATH), columns=PERSON_USECOLS
+        )
+        if "EmploymentNumber" in person_df.columns:
+            person_df["EmploymentNumber"] = person_df["EmploymentNumber"].astype(STRING_DTYPE)
+        person_df["EmploymentStartDate"] = pd.to_datetime(
+            person_df["EmploymentStartDate"], format="ISO8601", cache=True
+        )
 
     return calabrio_df, person_df
@@ -6,6 +6,7 @@ from dash import dcc, html
 from validation_config import (
     CALABRIO_DIR,
     CONFIG_DATA_PATH,
+    ROW_ID_COLUMN,
     WORKDAY_DIR,
     get_calabrio_file,
     get_config_file,
@@ -100,9 +101,10 @@ def create_filter_panel(filter_options):
 
 def create_validation_grid(validation_df):
     """Create validation grid component."""
-    return dag.AgGrid(
+    # Rows are served block by block from get_validation_rows (infinite row model)
+    grid = dag.AgGrid(
         id="validation-grid",
-        rowData=validation_df.to_dict("records"),
+        rowModelType="infinite",
         columnDefs=[
             {"field": "Calabrio BusinessUnitName", "headerName": "Business Unit"},
             {"field": "Workday Person Number", "headerName": "Workday Person Number"},
@@ -116,10 +118,32 @@ def create_validation_grid(validation_df):
             {"field": "Balance Match", "headerName": "Balance Match"},
             {"field": "Accrual Match", "headerName": "Accrual Match"},
             {"field": "Calabrio PersonId", "headerName": "Person ID"},
-            {"field": "AbsenceId", "headerName": "AbsenceId"},
+            {"field": "Absence ID", "headerName": "AbsenceId"},
             {"field": "StartDate", "headerName": "Start Date"},
         ],
-        dashGridOptions={"pagination": True, "paginationPageSize": 100, "rowSelection": "multiple"},
+        # Key rows by record rather than block position, so selections survive
+        # purgeInfiniteCache; ROW_ID_COLUMN keeps rows with the same pair distinct
+        getRowId=(
+            "`${params.data['Calabrio PersonId']}|${params.data['Absence ID']}"
+            f"|${{params.data.{ROW_ID_COLUMN}}}`"
+        ),
+        dashGridOptions={
+            "pagination": True,
+            "paginationPageSize": 100,
+            "rowSelection": "multiple",
+            "cacheBlockSize": 100,
+            "maxBlocksInCache": 10,
+            "rowBuffer": 20,
+            "infiniteInitialRowCount": len(validation_df),
+            "maxConcurrentDatasourceRequests": 2,
+        },
+    )
+    return html.Div(
+        [
+            dcc.Store(id="validation-filter-store", data={}),
+            html.Div(id="validation-grid-refresh", hidden=True),
+            grid,
+        ]
     )
 
 
@@ -1,4 +1,16 @@
 import pandas as pd
+from validation_utils import normalize_str_column
+
+# Low-cardinality text columns, stored as categoricals once preprocessed
+CATEGORICAL_COLUMNS = ("AbsenceType", "AbsenceName", "ContractName", "BusinessUnitName")
+
+
+def _categorize(df):
+    """Convert the CATEGORICAL_COLUMNS present in df to category dtype."""
+    for col in CATEGORICAL_COLUMNS:
+        if col in df.columns:
+            df[col] = df[col].astype("category")
+    return df
 
 
 def preprocess_workday_data(workday_df, people_df):
@@ -23,7 +35,11 @@ def preprocess_workday_data(workday_df, people_df):
 
     # Add MappedEmploymentNumber (using WiserId as fallback)
     workday_df["MappedEmploymentNumber"] = workday_df["WiserId"]
-    return workday_df
+
+    # Normalize WiserId once here; create_validation_table checks the flag
+    workday_df["WiserId"] = normalize_str_column(workday_df["WiserId"])
+    workday_df.attrs["_normalized"] = True
+    return _categorize(workday_df)
 
 
 def preprocess_calabrio_data(calabrio_df, calabrio_person_df):
@@ -44,4 +60,4 @@ def preprocess_calabrio_data(calabrio_df, calabrio_person_df):
                 how="left",
                 suffixes=("", "_person"),
             )
-    return calabrio_df
+    return _categorize(calabrio_df)
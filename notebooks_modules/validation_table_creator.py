@@ -1,19 +1,57 @@
+import hashlib
 import json
+import os
+from functools import lru_cache
 from pathlib import Path
 
+import numpy as np
 import pandas as pd
 
 from notebooks_modules.validation_calculator import BalanceCalculator
-from notebooks_modules.validation_utils import map_business_unit, safe_get_column
+from notebooks_modules.validation_utils import (
+    map_business_unit,
+    normalize_str_column,
+    safe_get_column,
+)
 
+# Date columns shown in the grid as YYYY-MM-DD strings
+DATE_COLUMNS = ("StartDate", "EmploymentStartDate", "Latest Headcount Hire Date")
 
-def map_absence_id(row, config_data):
+# Text columns with at most this ratio of distinct values are stored as categoricals
+CATEGORICAL_MAX_RATIO = 0.05
+
+
+def _index_absences(absences):
+    """
+    Builds lookup tables for one business unit's absences.
+
+    Args:
+        absences: List of absence dicts from config_data
+
+    Returns:
+        dict: "exact" and "lower" map names to Ids (first occurrence wins),
+            "names_lower" keeps (lower-cased name, Id) pairs in config order
+    """
+    exact = {}
+    lower = {}
+    names_lower = []
+    for absence in absences:
+        name_lower = absence.get("Name", "").lower()
+        exact.setdefault(absence.get("Name"), absence.get("Id"))
+        lower.setdefault(name_lower, absence.get("Id"))
+        names_lower.append((name_lower, absence.get("Id")))
+    return {"exact": exact, "lower": lower, "names_lower": names_lower}
+
+
+def map_absence_id(row, config_data, absence_index=None):
     """
     Retrieves AbsenceId from config_data using BusinessUnitName and AbsenceName.
 
     Args:
         row: DataFrame row
         config_data: Configuration data dictionary
+        absence_index: Optional dict caching _index_absences results per
+            business unit; pass the same dict across calls to reuse them
 
     Returns:
         str: AbsenceId, or None if not found
@@ -29,102 +67,195 @@ def map_absence_id(row, config_data):
             return None
         business_unit = mapped_bu
 
-    # Get absences list
-    absences = config_data.get(business_unit, {}).get("absences", {}).get("Result", [])
+    # Get absences lookups
+    if absence_index is None:
+        absence_index = {}
+    if business_unit not in absence_index:
+        absences = config_data.get(business_unit, {}).get("absences", {}).get("Result", [])
+        absence_index[business_unit] = _index_absences(absences)
+    index = absence_index[business_unit]
 
     # Attempt exact match
-    for absence in absences:
-        if absence.get("Name") == absence_name:
-            return absence.get("Id")
+    if absence_name in index["exact"]:
+        return index["exact"][absence_name]
 
     # Attempt case-insensitive match
     absence_name_lower = absence_name.lower()
-    for absence in absences:
-        if absence.get("Name", "").lower() == absence_name_lower:
-            return absence.get("Id")
+    if absence_name_lower in index["lower"]:
+        return index["lower"][absence_name_lower]
 
     # Attempt partial match
-    for absence in absences:
-        if absence_name_lower in absence.get("Name", "").lower():
-            return absence.get("Id")
+    for name_lower, absence_id in index["names_lower"]:
+        if absence_name_lower in name_lower:
+            return absence_id
 
     # Retry by adding 'Global -' prefix
-    if not absence_name.lower().startswith("global -"):
+    if not absence_name_lower.startswith("global -"):
         global_absence = f"Global - {absence_name}"
-        for absence in absences:
-            if absence.get("Name") == global_absence:
-                return absence.get("Id")
+        if global_absence in index["exact"]:
+            return index["exact"][global_absence]
 
     return None
 
 
-def add_absence_id_to_df(df, config_data):
+def add_absence_id_to_df(df, config_data, verbose=True):
     """
     Adds an AbsenceId column to the DataFrame.
 
     Args:
         df: Input DataFrame
         config_data: Configuration data dictionary
+        verbose: Print how many records were mapped
 
     Returns:
         DataFrame: DataFrame with AbsenceId column added
     """
-    # List to store results
-    absence_ids = []
-
-    # Process each row
-    for _, row in df.iterrows():
-        absence_id = map_absence_id(row, config_data)
-        absence_ids.append(absence_id)
+    keys = ["BusinessUnitName", "AbsenceName"]
+
+    # Map each distinct (BusinessUnitName, AbsenceName) pair once
+    pairs = df[keys].drop_duplicates()
+    absence_index = {}
+    pairs["AbsenceId"] = [
+        map_absence_id(
+            {"BusinessUnitName": business_unit, "AbsenceName": absence_name},
+            config_data,
+            absence_index,
+        )
+        for business_unit, absence_name in zip(pairs["BusinessUnitName"], pairs["AbsenceName"])
+    ]
+    absence_ids = df[keys].merge(pairs, on=keys, how="left")["AbsenceId"]
 
     # Create result DataFrame
     result_df = df.copy()
-    result_df["AbsenceId"] = absence_ids
+    result_df["AbsenceId"] = absence_ids.to_numpy()
 
     # Mapping results statistics
-    mapped_count = sum(1 for aid in absence_ids if aid is not None)
-    total_count = len(absence_ids)
-    print(
-        f"Mapping results: {mapped_count}/{total_count} ({mapped_count/total_count*100:.1f}%) records mapped with AbsenceId"
-    )
+    if verbose and len(absence_ids):
+        mapped_count = int(absence_ids.notna().sum())
+        total_count = len(absence_ids)
+        print(
+            f"Mapping results: {mapped_count}/{total_count} ({mapped_count/total_count*100:.1f}%) records mapped with AbsenceId"
+        )
 
     return result_df
 
 
+# Single-slot cache of the last validation table and the inputs it was built from
+_last_validation_table = {"key": None, "df": None}
+
+
+@lru_cache(maxsize=4)
+def _get_calculator(config_dir):
+    """Returns the BalanceCalculator for a config directory, created once."""
+    return BalanceCalculator(Path(config_dir, "balance_rules.json"))
+
+
+def _frame_fingerprint(df):
+    """Returns a content hash of a DataFrame, including its columns, shape and row order."""
+    row_hashes = pd.util.hash_pandas_object(df, index=False).to_numpy()
+    return df.shape, tuple(df.columns), hashlib.blake2b(row_hashes.tobytes()).hexdigest()
+
+
+def _to_int64(series, default=0):
+    """
+    Converts a column to rounded int64 values, with default for missing values.
+
+    Equivalent to pd.to_numeric(series, errors="coerce").fillna(default).round(),
+    but numeric columns skip the to_numeric pass. Missing values are always
+    filled, so a plain NumPy int64 column is enough (no nullable Int64 mask).
+    """
+    if not pd.api.types.is_numeric_dtype(series.dtype):
+        series = pd.to_numeric(series, errors="coerce")
+    values = series.to_numpy(dtype="float64", na_value=np.nan)
+    values = np.rint(np.where(np.isnan(values), default, values))
+    return pd.Series(values.astype(np.int64), index=series.index)
+
+
+def _categorize_repeated(df):
+    """
+    Converts text columns with few distinct values to categoricals, in place.
+
+    Categoricals carried over from the inputs drop unused categories, so every
+    category of the result occurs in the table.
+    """
+    if df.empty:
+        return df
+    for col in df.columns:
+        if isinstance(df[col].dtype, pd.CategoricalDtype):
+            df[col] = df[col].cat.remove_unused_categories()
+        elif df[col].dtype == object and df[col].nunique() / len(df) <= CATEGORICAL_MAX_RATIO:
+            df[col] = df[col].astype("category")
+    return df
+
+
+def _match_column(expected, actual):
+    """Returns "✅" where expected equals actual and "❌" elsewhere, including missing values."""
+    # Missing values become NaN, which never compares equal
+    expected = expected.to_numpy(dtype="float64", na_value=np.nan)
+    actual = actual.to_numpy(dtype="float64", na_value=np.nan)
+    return np.where(expected == actual, "✅", "❌")
+
+
 def create_validation_table(workday_df, calabrio_df, CONFIG_DIR):
-    """Create validation table comparing Workday and Calabrio data."""
-    # Clean and convert columns
-    workday_df = workday_df.copy()
-    calabrio_df = calabrio_df.copy()
-
-    workday_df["WiserId"] = workday_df["WiserId"].fillna("").astype(str).str.strip().str.lower()
-    workday_df["Original_AbsenceType_Case"] = (
-        workday_df["AbsenceType"].fillna("").astype(str).str.strip()
-    )
-    workday_df["AbsenceType"] = (
-        workday_df["AbsenceType"].fillna("").astype(str).str.strip().str.lower()
-    )
+    """
+    Create validation table comparing Workday and Calabrio data.
 
-    calabrio_df["EmploymentNumber"] = (
-        calabrio_df["EmploymentNumber"].fillna("").astype(str).str.strip().str.lower()
-    )
-    calabrio_df["AbsenceName"] = (
-        calabrio_df["AbsenceName"].fillna("").astype(str).str.strip().str.lower()
+    The last result is cached and returned (as a copy) while the input frames,
+    CONFIG_DIR and the balance rules file are unchanged.
+    """
+    rules_path = Path(CONFIG_DIR, "balance_rules.json")
+    try:
+        key = (
+            _frame_fingerprint(workday_df),
+            _frame_fingerprint(calabrio_df),
+            str(CONFIG_DIR),
+            os.path.getmtime(rules_path) if rules_path.exists() else None,
+        )
+    except TypeError:
+        # Unhashable cell values (e.g. lists); build without caching
+        return _build_validation_table(workday_df, calabrio_df, CONFIG_DIR)
+
+    if _last_validation_table["key"] != key:
+        _last_validation_table["df"] = _build_validation_table(workday_df, calabrio_df, CONFIG_DIR)
+        _last_validation_table["key"] = key
+    return _last_validation_table["df"].copy()
+
+
+def _build_validation_table(workday_df, calabrio_df, CONFIG_DIR):
+    """Build the validation table; see create_validation_table."""
+    # Shallow copies: the columns below are replaced, never written in place
+    workday_df = workday_df.copy(deep=False)
+    calabrio_df = calabrio_df.copy(deep=False)
+
+    # preprocess_workday_data may already have normalized WiserId
+    if not workday_df.attrs.get("_normalized"):
+        workday_df["WiserId"] = normalize_str_column(workday_df["WiserId"])
+    workday_df["Original_AbsenceType_Case"] = normalize_str_column(
+        workday_df["AbsenceType"], lower=False
     )
-
-    # Group Calabrio data
-    calabrio_grouped = (
-        calabrio_df.groupby(["EmploymentNumber", "AbsenceName"]).first().reset_index()
+    workday_df["AbsenceType"] = normalize_str_column(workday_df["Original_AbsenceType_Case"])
+
+    calabrio_df["EmploymentNumber"] = normalize_str_column(calabrio_df["EmploymentNumber"])
+    calabrio_df["AbsenceName"] = normalize_str_column(calabrio_df["AbsenceName"])
+
+    # Group Calabrio data: groupby().first() (first non-null value per column)
+    # only differs from the row itself for duplicated keys, so group just those
+    keys = ["EmploymentNumber", "AbsenceName"]
+    duplicated = calabrio_df.duplicated(keys, keep=False)
+    calabrio_first = pd.concat(
+        [
+            calabrio_df[~duplicated],
+            calabrio_df[duplicated].groupby(keys, sort=False).first().reset_index(),
+        ]
     )
 
-    # Merge data
-    merged_df = pd.merge(
-        workday_df,
-        calabrio_grouped,
-        left_on=["MappedEmploymentNumber", "AbsenceType"],
-        right_on=["EmploymentNumber", "AbsenceName"],
-        how="left",
+    # Merge data: one hash lookup per Workday row into the keyed Calabrio rows
+    lookup = pd.MultiIndex.from_arrays(
+        [workday_df["MappedEmploymentNumber"], workday_df["AbsenceType"]]
     )
+    calabrio_rows = calabrio_first.set_index(keys, drop=False).reindex(lookup)
+    calabrio_rows.index = workday_df.index
+    merged_df = workday_df.join(calabrio_rows, lsuffix="_x", rsuffix="_y").reset_index(drop=True)
 
     # Create display DataFrame
     display_df = pd.DataFrame(
@@ -137,24 +268,10 @@ def create_validation_table(workday_df, calabrio_df, CONFIG_DIR):
             "Calabrio BusinessUnitName": merged_df["BusinessUnitName"],
             "StartDate": merged_df["StartDate"],
             "ContractName": merged_df["ContractName"],
-            "Calabrio Balance In": pd.to_numeric(merged_df["BalanceIn"], errors="coerce")
-            .fillna(0)
-            .round()
-            .astype("Int64"),
-            "Calabrio_Accrued": pd.to_numeric(merged_df["Accrued"].fillna(0), errors="coerce")
-            .fillna(0)
-            .round()
-            .astype("Int64"),
-            "Calabrio Extra": pd.to_numeric(merged_df["Extra"].fillna(0), errors="coerce")
-            .fillna(0)
-            .round()
-            .astype("Int64"),
-            "Units Approved": pd.to_numeric(
-                safe_get_column(merged_df, ["Units Approved"], 0), errors="coerce"
-            )
-            .fillna(0)
-            .round()
-            .astype("Int64"),
+            "Calabrio Balance In": _to_int64(merged_df["BalanceIn"]),
+            "Calabrio_Accrued": _to_int64(merged_df["Accrued"]),
+            "Calabrio Extra": _to_int64(merged_df["Extra"]),
+            "Units Approved": _to_int64(safe_get_column(merged_df, ["Units Approved"], 0)),
             "TrackedBy": merged_df["TrackedBy"],
             "Calabrio PersonId": merged_df["PersonId"],
             "Beginning Year Balance": pd.to_numeric(
@@ -170,21 +287,18 @@ def create_validation_table(workday_df, calabrio_df, CONFIG_DIR):
     )
 
     # Calculate correct values
-    calculator = BalanceCalculator(Path(CONFIG_DIR, "balance_rules.json"))
-    display_df["Correct Balance In"], display_df["Correct_Accrued"] = zip(
-        *display_df.apply(
-            lambda row: calculator.calculate_correct_values(row, row["Workday Absence Type"]),
-            axis=1,
-        )
-    )
+    calculator = _get_calculator(str(CONFIG_DIR))
+    (
+        display_df["Correct Balance In"],
+        display_df["Correct_Accrued"],
+    ) = calculator.calculate_correct_values_df(display_df, "Workday Absence Type")
 
     # Calculate matches
-    display_df["Balance Match"] = display_df.apply(
-        lambda row: "✅" if row["Correct Balance In"] == row["Calabrio Balance In"] else "❌",
-        axis=1,
+    display_df["Balance Match"] = _match_column(
+        display_df["Correct Balance In"], display_df["Calabrio Balance In"]
     )
-    display_df["Accrual Match"] = display_df.apply(
-        lambda row: "✅" if row["Correct_Accrued"] == row["Calabrio_Accrued"] else "❌", axis=1
+    display_df["Accrual Match"] = _match_column(
+        display_df["Correct_Accrued"], display_df["Calabrio_Accrued"]
     )
 
     # Calculate balance difference
@@ -192,4 +306,9 @@ def create_validation_table(workday_df, calabrio_df, CONFIG_DIR):
         display_df["Correct Balance In"] - display_df["Calabrio Balance In"]
     )
 
-    return display_df
+    # Format dates once here so the grid does not convert them on every render
+    for col in DATE_COLUMNS:
+        if col in display_df.columns and pd.api.types.is_datetime64_any_dtype(display_df[col]):
+            display_df[col] = display_df[col].dt.strftime("%Y-%m-%d").fillna("")
+
+    return _categorize_repeated(display_df)
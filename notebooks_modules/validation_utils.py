@@ -1,5 +1,7 @@
 """Validation utility functions."""
 
+import json
+
 import numpy as np
 import pandas as pd
 from validation_config import (
@@ -11,33 +13,74 @@ from validation_config import (
     get_workday_file,
 )
 
+try:
+    import orjson
+except ImportError:  # orjson is optional; fall back to the stdlib parser
+    orjson = None
+
+
+def records_json(df):
+    """Convert a DataFrame to grid rowData (a list of JSON-ready row dicts)."""
+    # to_json serializes in C, which is much faster than to_dict("records")
+    data = df.to_json(orient="records", date_format="iso")
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def convert_to_upload_format_frame(df):
+    """Convert every row of a DataFrame to upload TSV format."""
+    if "Correct Balance In" in df.columns:
+        balance = df["Correct Balance In"]
+    else:
+        balance = df.get("Calabrio Balance In", pd.Series(0, index=df.index))
+
+    def to_int_str(values):
+        # Blank and missing values become 0
+        return pd.to_numeric(values, errors="coerce").fillna(0).astype(np.int64).astype(str)
+
+    person_id = df.get("Calabrio PersonId", pd.Series("", index=df.index)).astype(str)
+    # A missing Absence ID is written as "None", as str(None) always did
+    absence_id = df.get("Absence ID", pd.Series("None", index=df.index)).astype(str)
+    accrued = df.get("Correct_Accrued", pd.Series(0, index=df.index))
+    extra = df.get("Calabrio Extra", pd.Series(0, index=df.index))
+
+    return (
+        person_id
+        + "\t"
+        + absence_id
+        + "\t"
+        + to_int_str(balance)
+        + "\t"
+        + to_int_str(accrued)
+        + "\t"
+        + to_int_str(extra)
+    )
+
 
 def convert_to_upload_format(row):
     """Convert a row to upload TSV format."""
-    person_id = row.get("Calabrio PersonId", "")
-    absence_id = row.get("Absence ID")
-    balance = row.get("Correct Balance In", row.get("Calabrio Balance In", 0))
-    accrued = row.get("Correct_Accrued", 0)
-    extra = row.get("Calabrio Extra", 0)
+    return convert_to_upload_format_frame(pd.DataFrame([row])).iloc[0]
 
-    # Convert to integers
-    balance_int = int(balance) if pd.notna(balance) and str(balance).strip() != "" else 0
-    accrued_int = int(accrued) if pd.notna(accrued) and str(accrued).strip() != "" else 0
-    extra_int = int(extra) if pd.notna(extra) and str(extra).strip() != "" else 0
 
-    return f"{person_id}\t{absence_id}\t{balance_int}\t{accrued_int}\t{extra_int}"
+def _filter_options(series):
+    """
+    Return dropdown options for the distinct non-null values of series.
+
+    Categorical columns list their categories without scanning the rows, so
+    unused categories should be removed beforehand.
+    """
+    if isinstance(series.dtype, pd.CategoricalDtype):
+        values = series.cat.categories
+    else:
+        values = series.dropna().unique()
+    return [{"label": str(val), "value": str(val)} for val in values]
 
 
 def create_filter_options(validation_df):
     """Create filter options from validation DataFrame."""
-    absence_types = [
-        {"label": str(val), "value": str(val)}
-        for val in validation_df["Workday Absence Type"].dropna().unique()
-    ]
-    contracts = [
-        {"label": str(val), "value": str(val)}
-        for val in validation_df["ContractName"].dropna().unique()
-    ]
+    absence_types = _filter_options(validation_df["Workday Absence Type"])
+    contracts = _filter_options(validation_df["ContractName"])
     balance_matches = [{"label": "Match", "value": "✅"}, {"label": "Mismatch", "value": "❌"}]
     accrual_matches = [{"label": "Match", "value": "✅"}, {"label": "Mismatch", "value": "❌"}]
 
@@ -49,25 +92,59 @@ def create_filter_options(validation_df):
     }
 
 
-def filter_validation_data(
+# Low-cardinality columns the validation grid can be filtered on
+FILTER_COLUMNS = ["Workday Absence Type", "ContractName", "Balance Match", "Accrual Match"]
+
+
+def categorize_filter_columns(df):
+    """Return a copy of df with the filter columns stored as categoricals."""
+    return df.astype({col: "category" for col in FILTER_COLUMNS if col in df.columns})
+
+
+def build_filter_mask(
     df, absence_types=None, contracts=None, balance_matches=None, accrual_matches=None
 ):
-    """Filter validation DataFrame based on criteria."""
-    filtered_df = df.copy()
-
-    if absence_types:
-        filtered_df = filtered_df[filtered_df["Workday Absence Type"].isin(absence_types)]
+    """Build a boolean row mask for the given filter selections."""
+    mask = np.ones(len(df), dtype=bool)
 
-    if contracts:
-        filtered_df = filtered_df[filtered_df["ContractName"].isin(contracts)]
+    for col, values in zip(
+        FILTER_COLUMNS, [absence_types, contracts, balance_matches, accrual_matches]
+    ):
+        if values:
+            mask &= df[col].isin(values).to_numpy()
 
-    if balance_matches:
-        filtered_df = filtered_df[filtered_df["Balance Match"].isin(balance_matches)]
+    return mask
 
-    if accrual_matches:
-        filtered_df = filtered_df[filtered_df["Accrual Match"].isin(accrual_matches)]
 
-    return filtered_df
+def filter_validation_data(
+    df, absence_types=None, contracts=None, balance_matches=None, accrual_matches=None
+):
+    """
+    Filter validation DataFrame based on criteria.
+
+    Returns df itself (not a copy) when no filter is selected; treat the
+    result as read-only.
+    """
+    if not any((absence_types, contracts, balance_matches, accrual_matches)):
+        return df
+    return df[build_filter_mask(df, absence_types, contracts, balance_matches, accrual_matches)]
+
+
+def normalize_str_column(series, lower=True):
+    """
+    Strip (and lower-case) a column's values as strings in a single pass.
+
+    Equivalent to series.fillna("").astype(str).str.strip().str.lower().
+    """
+    values = series.to_numpy(dtype=object)
+    missing = pd.isna(values)
+    out = np.empty(len(values), dtype=object)
+    out[missing] = ""
+    if lower:
+        out[~missing] = [str(value).strip().lower() for value in values[~missing]]
+    else:
+        out[~missing] = [str(value).strip() for value in values[~missing]]
+    return pd.Series(out, index=series.index, name=series.name)
 
 
 def safe_get_column(df, possible_names, default_value=None):
@@ -78,6 +155,13 @@ def safe_get_column(df, possible_names, default_value=None):
     for name in possible_names:
         if name in df.columns:
             series = df[name]
+
+            # Already-typed columns only need their missing values filled
+            if pd.api.types.is_numeric_dtype(series.dtype):
+                return series.fillna(default_value if default_value is not None else 0)
+            if pd.api.types.is_datetime64_any_dtype(series.dtype):
+                return series.fillna(default_value if default_value is not None else pd.NaT)
+
             # First try to convert string representations of numbers
             try:
                 # Handle numeric columns
@@ -85,7 +169,7 @@ def safe_get_column(df, possible_names, default_value=None):
                 return pd.to_numeric(clean_series, errors="coerce").fillna(
                     default_value if default_value is not None else 0
                 )
-            except:
+            except (ValueError, TypeError):
                 pass
 
             # If not numeric, try datetime
@@ -94,7 +178,7 @@ def safe_get_column(df, possible_names, default_value=None):
                 return pd.to_datetime(series, errors="coerce").fillna(
                     default_value if default_value is not None else pd.NaT
                 )
-            except:
+            except (ValueError, TypeError):
                 # Handle string columns
                 return series.fillna(default_value if default_value is not None else "")
 
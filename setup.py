@@ -51,6 +51,11 @@ setup(
             "mypy>=1.5.0",
             "pylint>=2.17.0",
         ],
+        "fast": [
+            "orjson>=3.9.0",
+            "pyarrow>=14.0.0",
+            "python-calamine>=0.2.0",
+        ],
     },
     entry_points={
         "console_scripts": [
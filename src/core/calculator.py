@@ -1,19 +1,67 @@
 """Balance calculation logic with configurable rules."""
 
-import json
+import copy
 import logging
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, Tuple
+from typing import Any, ClassVar, Dict, Tuple
+
+import numpy as np
+import pandas as pd
 
 from ..utils.exceptions import CalculationError, ConfigurationError
+from ..utils.serialization import JSONDecodeError, load_json
+from ..utils.types import AbsenceRule, GlobalSettings
 
 logger = logging.getLogger(__name__)
 
 
+def _is_missing_date(value: Any) -> bool:
+    """Check for a missing date: None, an empty string, NaN or NaT."""
+    if isinstance(value, str):
+        return not value
+    return value is None or bool(pd.isna(value))
+
+
+@lru_cache(maxsize=4096)
+def _prorated_accrual(
+    hire_date: Any, full_accrual: float, monthly_rate: float, current_year: int
+) -> float:
+    """
+    Prorate accrual for a hashable hire date; memoized core of _prorate_accrual.
+
+    Args:
+        hire_date: Hire date as a "%Y-%m-%d" string or datetime-like value
+        full_accrual: Accrual for a full year
+        monthly_rate: Accrual earned per month employed
+        current_year: Year being calculated
+
+    Returns:
+        Prorated accrual, capped at full_accrual
+    """
+    # Convert hire_date to datetime if needed
+    if isinstance(hire_date, str):
+        hire_date = datetime.strptime(hire_date, "%Y-%m-%d")
+    elif hasattr(hire_date, "to_pydatetime"):
+        hire_date = hire_date.to_pydatetime()
+
+    # Calculate months employed this year
+    if hire_date.year < current_year:
+        return full_accrual
+
+    months_employed = 12 - hire_date.month + 1
+    prorated = months_employed * monthly_rate
+
+    return float(min(prorated, full_accrual))
+
+
 class BalanceCalculator:
     """Calculates correct balance values based on configurable rules."""
 
+    # Parsed rules files shared by all instances: path -> (mtime, rules)
+    _rules_cache: ClassVar[Dict[Path, Tuple[float, Dict[str, Any]]]] = {}
+
     def __init__(self, rules_file: Path):
         """
         Initialize calculator with rules file.
@@ -22,23 +70,61 @@ class BalanceCalculator:
             rules_file: Path to JSON file containing balance rules
         """
         self.rules_file = rules_file
+        self.current_year = datetime.now().year
         self.rules = self._load_rules()
 
     def _load_rules(self) -> Dict[str, Any]:
-        """Load balance calculation rules from JSON file."""
+        """Load balance calculation rules from JSON file and compile them."""
         if not self.rules_file.exists():
             logger.warning(f"Rules file not found: {self.rules_file}")
-            return self._get_default_rules()
+            rules = self._get_default_rules()
+        else:
+            try:
+                rules = self._read_rules_file()
+            except JSONDecodeError as e:
+                raise ConfigurationError(f"Invalid JSON in rules file: {e}")
+            except Exception as e:
+                raise ConfigurationError(f"Error loading rules file: {e}")
+
+        self._compile_rules(rules)
+        return rules
+
+    def _read_rules_file(self) -> Dict[str, Any]:
+        """
+        Read and parse the rules file, reusing the parse while its mtime is unchanged.
 
-        try:
-            with open(self.rules_file, "r", encoding="utf-8") as f:
-                rules = json.load(f)
+        Returns:
+            A copy of the parsed rules dictionary
+        """
+        mtime = self.rules_file.stat().st_mtime
+        cached = BalanceCalculator._rules_cache.get(self.rules_file)
+        if cached is None or cached[0] != mtime:
+            rules = dict(load_json(self.rules_file))
+            BalanceCalculator._rules_cache[self.rules_file] = (mtime, rules)
             logger.info(f"Loaded balance rules from {self.rules_file}")
-            return dict(rules)
-        except json.JSONDecodeError as e:
-            raise ConfigurationError(f"Invalid JSON in rules file: {e}")
-        except Exception as e:
-            raise ConfigurationError(f"Error loading rules file: {e}")
+        else:
+            rules = cached[1]
+        return copy.deepcopy(rules)
+
+    def _compile_rules(self, rules: Dict[str, Any]) -> None:
+        """
+        Resolve the rules' defaults once into AbsenceRule and GlobalSettings objects.
+
+        Args:
+            rules: Rules dictionary as loaded from the rules file
+
+        Raises:
+            ConfigurationError: If a rule value has the wrong type
+        """
+        try:
+            absence_rules = rules.get("absence_rules", {})
+            self._absence_rules: Dict[str, AbsenceRule] = {
+                key: AbsenceRule.from_config(config) for key, config in absence_rules.items()
+            }
+            self._default_rule = self._absence_rules.get("default", AbsenceRule())
+            self._global = GlobalSettings.from_config(rules)
+        except (TypeError, ValueError, AttributeError) as e:
+            raise ConfigurationError(f"Invalid balance rules: {e}")
 
     def _get_default_rules(self) -> Dict[str, Any]:
         """Get default balance calculation rules."""
@@ -85,12 +171,10 @@ class BalanceCalculator:
         try:
             # Get absence-specific rules
             absence_key = absence_type.lower() if absence_type else ""
-            absence_rules = self.rules.get("absence_rules", {}).get(
-                absence_key, self.rules.get("absence_rules", {}).get("default", {})
-            )
+            absence_rules = self._get_absence_rules(absence_key)
 
             # Get calculation method
-            calc_method = absence_rules.get("calculation_method", "standard")
+            calc_method = absence_rules.calculation_method
 
             if calc_method == "fixed":
                 return self._calculate_fixed_values(row, absence_rules)
@@ -106,65 +190,185 @@ class BalanceCalculator:
             logger.error(f"Error calculating values for {absence_type}: {e}")
             raise CalculationError(f"Failed to calculate balance: {e}")
 
+    def _get_absence_rules(self, absence_key: str) -> AbsenceRule:
+        """
+        Get the rule for a lower-cased absence type, falling back to "default".
+
+        Args:
+            absence_key: Lower-cased absence type
+
+        Returns:
+            Compiled rule for the absence type
+        """
+        return self._absence_rules.get(absence_key, self._default_rule)
+
+    def compute_frame(
+        self, df: pd.DataFrame, absence_type_column: str = "AbsenceType"
+    ) -> Tuple[pd.Series, pd.Series]:
+        """
+        Calculate correct balance and accrual values for every row of a DataFrame.
+
+        Vectorized equivalent of calling calculate_correct_values per row. Rules
+        are resolved once per distinct absence type, broadcast to per-row
+        parameter arrays and applied to all rows in one pass of NumPy operations.
+
+        Args:
+            df: DataFrame containing employee data
+            absence_type_column: Column holding each row's absence type
+
+        Returns:
+            Tuple of (correct_balance_in, correct_accrued) Series aligned with df
+
+        Raises:
+            CalculationError: If the values cannot be calculated
+        """
+        try:
+            beginning_balance = self._numeric_column(
+                df, "Beginning Year Balance", self._global.beginning_year_balance
+            )
+            accrued_this_year = self._numeric_column(
+                df, "Accrued this year", self._global.accrued_this_year
+            )
+            hire_dates = self._hire_dates(df)
+
+            absence_keys = df[absence_type_column].fillna("").astype(str).str.lower()
+            codes, absence_types = pd.factorize(absence_keys)
+            rules = [self._get_absence_rules(absence_key) for absence_key in absence_types]
+
+            for absence_rules in rules:
+                calc_method = absence_rules.calculation_method
+                if calc_method == "custom" and absence_rules.formula:
+                    logger.warning(f"Custom formula not implemented: {absence_rules.formula}")
+                elif calc_method not in ("standard", "custom", "fixed"):
+                    logger.warning(f"Unknown calculation method: {calc_method}")
+
+            def per_row(field: str, dtype: Any = np.float64) -> np.ndarray:
+                return np.array([getattr(rule, field) for rule in rules], dtype=dtype)[codes]
+
+            balance, accrual = self._standard_values_array(
+                beginning_balance,
+                accrued_this_year,
+                hire_dates,
+                max_carryover=per_row("max_carryover"),
+                prorate=per_row("prorate_first_year", bool),
+                accrual_rate=per_row("accrual_rate"),
+            )
+
+            fixed = np.array([rule.calculation_method == "fixed" for rule in rules], dtype=bool)
+            fixed = fixed[codes]
+            balance = np.where(fixed, per_row("fixed_balance"), balance)
+            accrual = np.where(fixed, per_row("fixed_accrual"), accrual)
+
+            return pd.Series(balance, index=df.index), pd.Series(accrual, index=df.index)
+
+        except Exception as e:
+            logger.error(f"Error calculating values for DataFrame: {e}")
+            raise CalculationError(f"Failed to calculate balance: {e}")
+
+    @staticmethod
+    def _numeric_column(df: pd.DataFrame, column: str, default: float) -> np.ndarray:
+        """Get a column as a float array, or an array of the default if it is missing."""
+        if column not in df.columns:
+            return np.full(len(df), float(default))
+        return df[column].astype(np.float64).to_numpy()
+
+    @staticmethod
+    def _hire_dates(df: pd.DataFrame) -> pd.Series:
+        """Get each row's hire date, falling back to EmploymentStartDate."""
+        missing = pd.Series(pd.NaT, index=df.index)
+        hire_dates = df.get("Latest Headcount Hire Date", missing)
+        hire_dates = hire_dates.where(
+            hire_dates.notna() & (hire_dates != ""), df.get("EmploymentStartDate", missing)
+        )
+        # Strings must be plain dates, as in _prorate_accrual
+        return pd.to_datetime(hire_dates, format="%Y-%m-%d", errors="coerce")
+
+    def _standard_values_array(
+        self,
+        beginning_balance: np.ndarray,
+        accrued_this_year: np.ndarray,
+        hire_dates: pd.Series,
+        max_carryover: np.ndarray,
+        prorate: np.ndarray,
+        accrual_rate: np.ndarray,
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """Vectorized _calculate_standard_values with each row's rule parameters."""
+        # Apply carryover limits
+        beginning_balance = np.minimum(beginning_balance, max_carryover)
+
+        # Prorate accrual for employees hired this year
+        if prorate.any():
+            hired_this_year = prorate & (hire_dates.dt.year >= self.current_year).to_numpy()
+            months_employed = 12 - hire_dates.dt.month.to_numpy(dtype=np.float64) + 1
+            prorated = months_employed * accrual_rate
+            accrued_this_year = np.where(
+                hired_this_year, np.fmin(prorated, accrued_this_year), accrued_this_year
+            )
+
+        # Apply global settings (fmax maps NaN to the minimum, like _apply_limits)
+        settings = self._global
+        correct_balance = np.fmax(
+            np.minimum(beginning_balance, settings.max_balance), settings.min_balance
+        )
+        correct_accrual = np.fmax(np.minimum(accrued_this_year, settings.max_accrual), 0)
+
+        # Round values (np.rint rounds half to even, like round)
+        round_to = settings.round_to_nearest
+        correct_balance = np.rint(correct_balance / round_to) * round_to
+        correct_accrual = np.rint(correct_accrual / round_to) * round_to
+
+        return correct_balance, correct_accrual
+
     def _calculate_fixed_values(
-        self, row: Dict[str, Any], rules: Dict[str, Any]
+        self, row: Dict[str, Any], rules: AbsenceRule
     ) -> Tuple[float, float]:
         """Calculate fixed balance values."""
-        fixed_balance = float(rules.get("fixed_balance", 0))
-        fixed_accrual = float(rules.get("fixed_accrual", 0))
-
-        return fixed_balance, fixed_accrual
+        return rules.fixed_balance, rules.fixed_accrual
 
     def _calculate_standard_values(
-        self, row: Dict[str, Any], rules: Dict[str, Any]
+        self, row: Dict[str, Any], rules: AbsenceRule
     ) -> Tuple[float, float]:
         """Calculate standard balance values based on employment data."""
         # Get default values
-        defaults = self.rules.get("default_values", {})
+        settings = self._global
         beginning_balance = float(
-            row.get("Beginning Year Balance", defaults.get("beginning_year_balance", 0))
-        )
-        accrued_this_year = float(
-            row.get("Accrued this year", defaults.get("accrued_this_year", 0))
+            row.get("Beginning Year Balance", settings.beginning_year_balance)
         )
+        accrued_this_year = float(row.get("Accrued this year", settings.accrued_this_year))
 
         # Apply carryover limits
-        max_carryover = float(rules.get("max_carryover", float("inf")))
-        if beginning_balance > max_carryover:
-            beginning_balance = max_carryover
+        if beginning_balance > rules.max_carryover:
+            beginning_balance = rules.max_carryover
 
         # Calculate accrual based on employment duration
-        hire_date = row.get("Latest Headcount Hire Date") or row.get("EmploymentStartDate")
-        if hire_date and rules.get("prorate_first_year", False):
+        hire_date = row.get("Latest Headcount Hire Date")
+        if _is_missing_date(hire_date):
+            hire_date = row.get("EmploymentStartDate")
+        if not _is_missing_date(hire_date) and rules.prorate_first_year:
             accrued_this_year = self._prorate_accrual(
-                hire_date, accrued_this_year, float(rules.get("accrual_rate", 0))
+                hire_date, accrued_this_year, rules.accrual_rate
             )
 
         # Apply global settings
-        global_settings = self.rules.get("global_settings", {})
         correct_balance = self._apply_limits(
-            beginning_balance,
-            global_settings.get("min_balance", 0),
-            global_settings.get("max_balance", 999),
-        )
-        correct_accrual = self._apply_limits(
-            accrued_this_year, 0, global_settings.get("max_accrual", 999)
+            beginning_balance, settings.min_balance, settings.max_balance
         )
+        correct_accrual = self._apply_limits(accrued_this_year, 0, settings.max_accrual)
 
         # Round values
-        round_to = global_settings.get("round_to_nearest", 1)
+        round_to = settings.round_to_nearest
         correct_balance = round(correct_balance / round_to) * round_to
         correct_accrual = round(correct_accrual / round_to) * round_to
 
         return correct_balance, correct_accrual
 
     def _calculate_custom_values(
-        self, row: Dict[str, Any], rules: Dict[str, Any]
+        self, row: Dict[str, Any], rules: AbsenceRule
     ) -> Tuple[float, float]:
         """Calculate custom balance values using formula."""
         # This is a placeholder for custom calculation logic
         # Could be extended to support formula evaluation
-        formula = rules.get("formula", "")
+        formula = rules.formula
         if not formula:
             return self._calculate_standard_values(row, rules)
 
@@ -174,25 +378,11 @@ class BalanceCalculator:
 
     def _prorate_accrual(self, hire_date: Any, full_accrual: float, monthly_rate: float) -> float:
         """Prorate accrual based on hire date."""
-        if not hire_date:
+        if _is_missing_date(hire_date):
             return full_accrual
 
         try:
-            # Convert hire_date to datetime if needed
-            if isinstance(hire_date, str):
-                hire_date = datetime.strptime(hire_date, "%Y-%m-%d")
-            elif hasattr(hire_date, "to_pydatetime"):
-                hire_date = hire_date.to_pydatetime()
-
-            # Calculate months employed this year
-            current_year = datetime.now().year
-            if hire_date.year < current_year:
-                return full_accrual
-
-            months_employed = 12 - hire_date.month + 1
-            prorated = months_employed * monthly_rate
-
-            return float(min(prorated, full_accrual))
+            return _prorated_accrual(hire_date, full_accrual, monthly_rate, self.current_year)
 
         except Exception as e:
             logger.warning(f"Error prorating accrual: {e}")
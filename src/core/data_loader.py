@@ -1,25 +1,178 @@
 """Data loading functionality with type hints and error handling."""
 
-import json
 import logging
+import os
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
+from functools import partial
 from pathlib import Path
-from typing import Tuple
+from typing import Any, Callable, ClassVar, Dict, List, Optional, Sequence, Tuple, Union
 
 import pandas as pd
 
 from ..utils.exceptions import DataLoadError
+from ..utils.serialization import JSONDecodeError, load_json_lines, loads
+from ..utils.types import DATE_FORMAT, STRING_DTYPE
+
+try:
+    import python_calamine  # noqa: F401
+
+    # Rust-based reader; returns the same frames as openpyxl, several times faster.
+    # pandas only has the calamine engine from 2.2 on.
+    _PANDAS_VERSION = tuple(int(part) for part in pd.__version__.split(".")[:2])
+    EXCEL_ENGINE = "calamine" if _PANDAS_VERSION >= (2, 2) else "openpyxl"
+except ImportError:
+    EXCEL_ENGINE = "openpyxl"
+
+try:
+    from pyarrow import ArrowInvalid
+    from pyarrow import json as pa_json
+except ImportError:
+    pa_json = None
+
+# Calabrio account balance columns; invalid or missing values load as 0
+ACCOUNT_NUMERIC_COLUMNS = ("BalanceIn", "Accrued", "Extra")
+
+# File suffixes read as JSON Lines (one record per line) instead of one document
+JSON_LINES_SUFFIXES = (".jsonl", ".ndjson")
 
 logger = logging.getLogger(__name__)
 
 
+def _key_column(series: pd.Series) -> pd.Series:
+    """
+    Convert an ID column to nullable Int64 when it is purely numeric.
+
+    Integer columns, float columns holding whole numbers (IDs read next to
+    blank cells) and text columns whose every value is a plain integer
+    (e.g. "12345", but not "" or "00123") become Int64, which joins faster
+    than strings. Anything else becomes STRING_DTYPE strings. Missing values
+    stay missing either way.
+
+    Args:
+        series: ID column as loaded
+
+    Returns:
+        The IDs as Int64 or strings
+    """
+    if pd.api.types.is_integer_dtype(series.dtype):
+        return series.astype("Int64")
+    if pd.api.types.is_float_dtype(series.dtype):
+        values = series.dropna()
+        if (values == values.round()).all():
+            return series.astype("Int64")
+        return series.astype(STRING_DTYPE)
+
+    strings = series.astype(STRING_DTYPE)
+    numbers = pd.to_numeric(strings, errors="coerce")
+    if (
+        pd.api.types.is_integer_dtype(numbers.dtype)
+        and numbers.notna().sum() == strings.notna().sum()
+        # Round trip guards against leading zeros, signs and whitespace
+        and (numbers.astype(STRING_DTYPE) == strings).all()
+    ):
+        return numbers.astype("Int64")
+    return strings
+
+
+def _frame_from_list(parsed: List[Any]) -> pd.DataFrame:
+    """
+    Build a DataFrame from a parsed JSON array.
+
+    Lists of records (the Calabrio exports) go through DataFrame.from_records,
+    which skips DataFrame's input dispatch; anything else, such as a list of
+    scalars, is passed to the DataFrame constructor as before.
+
+    Args:
+        parsed: Parsed JSON array
+
+    Returns:
+        DataFrame with loaded data
+    """
+    if all(isinstance(item, dict) for item in parsed):
+        return pd.DataFrame.from_records(parsed)
+    return pd.DataFrame(parsed)
+
+
+def _run_concurrently(loaders: List[Callable[[], pd.DataFrame]]) -> List[pd.DataFrame]:
+    """
+    Run independent loaders on a thread pool and return their results in order.
+
+    Every loader runs to completion; unexpected errors are logged per loader
+    and the first one is re-raised once all have finished.
+
+    Args:
+        loaders: Callables that each load one DataFrame
+
+    Returns:
+        The loaded DataFrames, in the order of loaders
+    """
+    with ThreadPoolExecutor(max_workers=len(loaders)) as executor:
+        futures: List[Future] = [executor.submit(loader) for loader in loaders]
+        wait(futures)
+
+    for loader, future in zip(loaders, futures):
+        if future.exception() is not None:
+            # functools.partial loaders have no __name__
+            name = getattr(loader, "__name__", repr(loader))
+            logger.error(f"{name} failed: {future.exception()}")
+    return [future.result() for future in futures]
+
+
 class DataLoader:
     """Handles loading data from various sources."""
 
-    @staticmethod
-    def load_excel_files(directory: Path, skiprows: int = 0) -> pd.DataFrame:
+    # Latest Excel file per directory, keyed to the directory's mtime
+    _latest_file_cache: ClassVar[Dict[Path, Tuple[float, Optional[Path]]]] = {}
+
+    @classmethod
+    def _latest_excel_file(cls, directory: Path) -> Optional[Path]:
+        """
+        Find the most recently modified Excel file in a directory.
+
+        The result is cached until the directory's mtime changes (a file is
+        added, removed or renamed), so repeated loads skip the directory scan
+        and the per-file stat calls.
+
+        Args:
+            directory: Path to the directory containing Excel files
+
+        Returns:
+            Path to the latest Excel file, or None if there is none
+
+        Raises:
+            DataLoadError: If the directory doesn't exist
+        """
+        try:
+            mtime = directory.stat().st_mtime
+        except FileNotFoundError:
+            raise DataLoadError(f"Directory does not exist: {directory}")
+
+        cached = cls._latest_file_cache.get(directory)
+        if cached is not None and cached[0] == mtime and (cached[1] is None or cached[1].exists()):
+            return cached[1]
+
+        # One directory read; DirEntry.stat() caches its result per entry
+        try:
+            with os.scandir(directory) as entries:
+                excel_files = [
+                    entry for entry in entries if entry.name.endswith(".xlsx") and entry.is_file()
+                ]
+        except NotADirectoryError:
+            excel_files = []
+        latest = max(excel_files, key=lambda x: x.stat().st_mtime) if excel_files else None
+        latest_file = Path(latest.path) if latest is not None else None
+        cls._latest_file_cache[directory] = (mtime, latest_file)
+        return latest_file
+
+    @classmethod
+    def load_excel_files(cls, directory: Path, skiprows: int = 0) -> pd.DataFrame:
         """
         Load the latest Excel file from a directory.
 
+        Reads with EXCEL_ENGINE: calamine when python-calamine is installed,
+        otherwise openpyxl (which pandas already opens in read-only mode).
+
         Args:
             directory: Path to the directory containing Excel files
             skiprows: Number of rows to skip when reading
@@ -30,27 +183,82 @@ class DataLoader:
         Raises:
             DataLoadError: If directory doesn't exist or no Excel files found
         """
-        if not directory.exists():
-            raise DataLoadError(f"Directory does not exist: {directory}")
-
-        excel_files = list(directory.glob("*.xlsx"))
-        if not excel_files:
+        latest_file = cls._latest_excel_file(directory)
+        if latest_file is None:
             logger.warning(f"No Excel files found in {directory}")
             return pd.DataFrame()
 
-        latest_file = max(excel_files, key=lambda x: x.stat().st_mtime)
         logger.info(f"Loading Excel file: {latest_file}")
 
         try:
-            return pd.read_excel(latest_file, skiprows=skiprows, engine="openpyxl")
+            return pd.read_excel(latest_file, skiprows=skiprows, engine=EXCEL_ENGINE)
+        except Exception as e:
+            raise DataLoadError(f"Failed to load Excel file {latest_file}: {e}")
+
+    @classmethod
+    def load_excel_sheets(
+        cls, directory: Path, sheets: Sequence[str], skiprows: int = 0
+    ) -> Dict[str, pd.DataFrame]:
+        """
+        Load several sheets from the latest Excel file in a directory.
+
+        The workbook is opened once and every sheet is read from the same
+        handle, instead of re-parsing the file per sheet.
+
+        Args:
+            directory: Path to the directory containing Excel files
+            sheets: Names of the sheets to read
+            skiprows: Number of rows to skip when reading each sheet
+
+        Returns:
+            Dictionary of DataFrames keyed by sheet name; empty DataFrames
+            if the directory has no Excel files
+
+        Raises:
+            DataLoadError: If directory doesn't exist or a sheet cannot be read
+        """
+        latest_file = cls._latest_excel_file(directory)
+        if latest_file is None:
+            logger.warning(f"No Excel files found in {directory}")
+            return {sheet: pd.DataFrame() for sheet in sheets}
+
+        logger.info(f"Loading sheets {list(sheets)} from Excel file: {latest_file}")
+
+        try:
+            with pd.ExcelFile(latest_file, engine=EXCEL_ENGINE) as workbook:
+                return {sheet: workbook.parse(sheet, skiprows=skiprows) for sheet in sheets}
         except Exception as e:
             raise DataLoadError(f"Failed to load Excel file {latest_file}: {e}")
 
     @staticmethod
-    def load_json_file(file_path: Path) -> pd.DataFrame:
+    def _load_json_lines(file_path: Path) -> pd.DataFrame:
+        """
+        Load a JSON Lines file into a DataFrame.
+
+        Uses pyarrow's multithreaded JSON reader when pyarrow is installed, and
+        parses line by line when it is not or when pyarrow rejects the file
+        (e.g. NaN tokens or values of mixed types in a column).
+
+        Args:
+            file_path: Path to the JSON Lines file
+
+        Returns:
+            DataFrame with one row per record
+        """
+        if pa_json is not None:
+            try:
+                return pa_json.read_json(str(file_path)).to_pandas()
+            except ArrowInvalid as e:
+                logger.debug(f"pyarrow could not read {file_path}, parsing line by line: {e}")
+        return _frame_from_list(load_json_lines(file_path))
+
+    @classmethod
+    def load_json_file(cls, file_path: Path) -> pd.DataFrame:
         """
         Load JSON data into a DataFrame.
 
+        Files with a JSON_LINES_SUFFIXES suffix are read as JSON Lines records.
+
         Args:
             file_path: Path to the JSON file
 
@@ -64,14 +272,48 @@ class DataLoader:
             raise DataLoadError(f"JSON file does not exist: {file_path}")
 
         try:
-            with open(file_path, "r", encoding="utf-8") as f:
-                json_data = json.load(f)
-            return pd.DataFrame(json_data)
-        except json.JSONDecodeError as e:
+            if file_path.suffix.lower() in JSON_LINES_SUFFIXES:
+                return cls._load_json_lines(file_path)
+            return cls.load_json_bytes(file_path.read_bytes())
+        except JSONDecodeError as e:
             raise DataLoadError(f"Invalid JSON in {file_path}: {e}")
         except Exception as e:
             raise DataLoadError(f"Failed to load JSON file {file_path}: {e}")
 
+    @staticmethod
+    def load_json_bytes(data: Union[bytes, str]) -> pd.DataFrame:
+        """
+        Build a DataFrame from an in-memory JSON document.
+
+        This is the parsing step of load_json_file, for callers (and tests)
+        that already hold the document.
+
+        Args:
+            data: JSON document, a list of records or a column mapping
+
+        Returns:
+            DataFrame with loaded data
+
+        Raises:
+            JSONDecodeError: If the document is not valid JSON
+        """
+        parsed = loads(data)
+        if isinstance(parsed, list):
+            return _frame_from_list(parsed)
+        return pd.DataFrame(parsed)
+
+
+@dataclass(frozen=True)
+class ExcelLoadSpec:
+    """How to load and clean one Workday Excel export."""
+
+    name: str
+    directory: Path
+    skiprows: int
+    rename: Dict[str, str] = field(default_factory=dict)
+    key_cols: Tuple[str, ...] = ()
+    date_cols: Tuple[str, ...] = ()
+
 
 class WorkdayDataLoader:
     """Loads and processes Workday data."""
@@ -82,6 +324,20 @@ class WorkdayDataLoader:
         self.used_entries_dir = used_entries_dir
         self.loader = DataLoader()
 
+        # One spec per file, in the order load_all_data returns them
+        self.load_specs = [
+            ExcelLoadSpec("person accounts", person_accounts_dir, 6, key_cols=("WiserId",)),
+            ExcelLoadSpec(
+                "people",
+                people_dir,
+                2,
+                rename={"Latest Headcount Wiser ID": "WiserId"},
+                key_cols=("WiserId",),
+                date_cols=("Latest Headcount Hire Date",),
+            ),
+            ExcelLoadSpec("used entries", used_entries_dir, 6, key_cols=("WiserId",)),
+        ]
+
     def load_all_data(self) -> Tuple[pd.DataFrame, pd.DataFrame, pd.DataFrame]:
         """
         Load all Workday data files.
@@ -89,52 +345,41 @@ class WorkdayDataLoader:
         Returns:
             Tuple of (workday_df, people_df, used_entries_df)
         """
-        workday_df = self._load_person_accounts()
-        people_df = self._load_people_data()
-        used_entries_df = self._load_used_entries()
+        # The files are independent, so parse them concurrently
+        workday_df, people_df, used_entries_df = _run_concurrently(
+            [partial(self._load_spec, spec) for spec in self.load_specs]
+        )
 
         return workday_df, people_df, used_entries_df
 
-    def _load_person_accounts(self) -> pd.DataFrame:
-        """Load person accounts data."""
-        try:
-            df = self.loader.load_excel_files(self.person_accounts_dir, skiprows=6)
-            if not df.empty and "WiserId" in df.columns:
-                df["WiserId"] = df["WiserId"].astype(str)
-            return df
-        except DataLoadError:
-            logger.warning("Failed to load person accounts data")
-            return pd.DataFrame()
+    def _load_spec(self, spec: ExcelLoadSpec) -> pd.DataFrame:
+        """
+        Load one Excel export and normalize its key and date columns.
 
-    def _load_people_data(self) -> pd.DataFrame:
-        """Load people data."""
-        try:
-            df = self.loader.load_excel_files(self.people_dir, skiprows=2)
-            if not df.empty:
-                # Rename columns if they exist
-                if "Latest Headcount Wiser ID" in df.columns:
-                    df.rename(columns={"Latest Headcount Wiser ID": "WiserId"}, inplace=True)
-                    df["WiserId"] = df["WiserId"].astype(str)
-
-                # Convert date columns
-                if "Latest Headcount Hire Date" in df.columns:
-                    df["Latest Headcount Hire Date"] = pd.to_datetime(
-                        df["Latest Headcount Hire Date"], errors="coerce"
-                    )
-            return df
-        except DataLoadError:
-            logger.warning("Failed to load people data")
-            return pd.DataFrame()
+        Args:
+            spec: What to load and how to clean it
 
-    def _load_used_entries(self) -> pd.DataFrame:
-        """Load used entries data."""
+        Returns:
+            DataFrame with loaded data, or an empty DataFrame if loading failed
+        """
         try:
-            df = self.loader.load_excel_files(self.used_entries_dir, skiprows=6)
-            if not df.empty and "WiserId" in df.columns:
-                df["WiserId"] = df["WiserId"].astype(str)
+            df = self.loader.load_excel_files(spec.directory, skiprows=spec.skiprows)
+            if df.empty:
+                return df
+
+            if spec.rename:
+                df = df.rename(columns=spec.rename)
+            for col in spec.key_cols:
+                if col in df.columns:
+                    df[col] = _key_column(df[col])
+            for col in spec.date_cols:
+                if col in df.columns:
+                    df[col] = pd.to_datetime(
+                        df[col], format=DATE_FORMAT, errors="coerce", cache=True
+                    )
             return df
         except DataLoadError:
-            logger.warning("Failed to load used entries data")
+            logger.warning(f"Failed to load {spec.name} data")
             return pd.DataFrame()
 
 
@@ -153,8 +398,9 @@ class CalabrioDataLoader:
         Returns:
             Tuple of (calabrio_df, person_df)
         """
-        calabrio_df = self._load_account_data()
-        person_df = self._load_person_data()
+        calabrio_df, person_df = _run_concurrently(
+            [self._load_account_data, self._load_person_data]
+        )
 
         return calabrio_df, person_df
 
@@ -164,9 +410,10 @@ class CalabrioDataLoader:
             df = self.loader.load_json_file(self.account_data_path)
             if not df.empty:
                 if "EmploymentNumber" in df.columns:
-                    df["EmploymentNumber"] = df["EmploymentNumber"].astype(str)
-                if "Accrued" in df.columns:
-                    df["Accrued"] = pd.to_numeric(df["Accrued"], errors="coerce").fillna(0)
+                    df["EmploymentNumber"] = _key_column(df["EmploymentNumber"])
+                for col in ACCOUNT_NUMERIC_COLUMNS:
+                    if col in df.columns:
+                        df[col] = pd.to_numeric(df[col], errors="coerce").fillna(0)
             return df
         except DataLoadError:
             logger.warning("Failed to load Calabrio account data")
@@ -178,10 +425,13 @@ class CalabrioDataLoader:
             df = self.loader.load_json_file(self.person_data_path)
             if not df.empty:
                 if "EmploymentNumber" in df.columns:
-                    df["EmploymentNumber"] = df["EmploymentNumber"].astype(str)
+                    df["EmploymentNumber"] = _key_column(df["EmploymentNumber"])
                 if "EmploymentStartDate" in df.columns:
                     df["EmploymentStartDate"] = pd.to_datetime(
-                        df["EmploymentStartDate"], errors="coerce"
+                        df["EmploymentStartDate"],
+                        format=DATE_FORMAT,
+                        errors="coerce",
+                        cache=True,
                     )
             return df
         except DataLoadError:
@@ -1,10 +1,29 @@
 """Data preprocessing functionality with type hints."""
 
 import logging
+from typing import Any, Dict, Optional
 
+import numpy as np
 import pandas as pd
 
 from ..utils.exceptions import ValidationError
+from ..utils.mappers import build_absence_index, map_absence_id
+from ..utils.types import DATE_FORMAT, STRING_DTYPE
+
+# Column groups converted by DataPreprocessor.standardize_column_types
+LOWERCASE_COLUMNS = ("WiserId", "EmploymentNumber", "AbsenceType", "AbsenceName")
+NUMERIC_COLUMNS = (
+    "BalanceIn",
+    "Accrued",
+    "Extra",
+    "Units Approved",
+    "Beginning Year Balance",
+    "Accrued this year",
+)
+DATE_COLUMNS = ("StartDate", "EmploymentStartDate", "Latest Headcount Hire Date")
+
+# Text columns with a few distinct values, stored as categoricals
+CATEGORICAL_COLUMNS = ("AbsenceType", "AbsenceName", "BusinessUnitName")
 
 logger = logging.getLogger(__name__)
 
@@ -12,6 +31,40 @@ logger = logging.getLogger(__name__)
 class DataPreprocessor:
     """Handles data preprocessing and merging operations."""
 
+    @staticmethod
+    def _left_join(
+        left: pd.DataFrame, right: pd.DataFrame, key: str, suffix: str = "_y"
+    ) -> pd.DataFrame:
+        """
+        Left-join right's columns onto left by key, as pd.merge(how="left") would.
+
+        When right's keys are unique, this is a single index lookup per left row;
+        duplicate keys are logged and joined with pd.merge, which repeats the
+        matching left rows. If only one side's keys are integers (the loaders
+        keep purely numeric IDs as Int64), both sides are joined as strings.
+
+        Args:
+            left: DataFrame holding the key column
+            right: Lookup DataFrame with a key column
+            key: Join key column
+            suffix: Suffix for right's columns that clash with left's
+
+        Returns:
+            Joined DataFrame with a fresh RangeIndex
+        """
+        if pd.api.types.is_integer_dtype(left[key]) != pd.api.types.is_integer_dtype(right[key]):
+            left = left.assign(**{key: left[key].astype(STRING_DTYPE)})
+            right = right.assign(**{key: right[key].astype(STRING_DTYPE)})
+
+        lookup = right.set_index(key)
+        if lookup.index.has_duplicates:
+            duplicates = int(lookup.index.duplicated().sum())
+            logger.warning(f"{duplicates} duplicate {key} values in lookup data; rows will repeat")
+            return pd.merge(
+                left, lookup.reset_index(), on=key, how="left", suffixes=("", suffix)
+            )
+        return left.join(lookup, on=key, how="left", rsuffix=suffix).reset_index(drop=True)
+
     @staticmethod
     def merge_workday_with_people(
         workday_df: pd.DataFrame, people_df: pd.DataFrame
@@ -60,7 +113,7 @@ class DataPreprocessor:
             merge_cols = required_people_cols
 
         # Perform merge
-        result_df = pd.merge(workday_df, people_df[merge_cols], on="WiserId", how="left")
+        result_df = DataPreprocessor._left_join(workday_df, people_df[merge_cols], "WiserId")
 
         # Add MappedEmploymentNumber (using WiserId as fallback)
         result_df["MappedEmploymentNumber"] = result_df["WiserId"]
@@ -109,12 +162,8 @@ class DataPreprocessor:
                 merge_cols.append(col)
 
         # Perform merge
-        result_df = pd.merge(
-            calabrio_df,
-            person_df[merge_cols],
-            on="EmploymentNumber",
-            how="left",
-            suffixes=("", "_person"),
+        result_df = DataPreprocessor._left_join(
+            calabrio_df, person_df[merge_cols], "EmploymentNumber", suffix="_person"
         )
 
         logger.info(
@@ -123,42 +172,102 @@ class DataPreprocessor:
 
         return result_df
 
+    @staticmethod
+    def add_absence_ids(
+        df: pd.DataFrame,
+        config_data: Dict[str, Any],
+        absence_index: Optional[Dict[str, Dict[str, Any]]] = None,
+    ) -> pd.DataFrame:
+        """
+        Add an AbsenceId column mapped from BusinessUnitName and AbsenceName.
+
+        Each distinct (BusinessUnitName, AbsenceName) pair is looked up once with
+        map_absence_id and the results are broadcast back to the rows by their
+        factorized codes, instead of calling it per row. Rows with a missing
+        business unit or absence name get None.
+
+        Args:
+            df: DataFrame with BusinessUnitName and AbsenceName columns
+            config_data: Configuration data dictionary
+            absence_index: Lookups from build_absence_index(config_data), if
+                already built (e.g. Config.get_absence_index())
+
+        Returns:
+            Copy of df with an AbsenceId column
+
+        Raises:
+            ValidationError: If either key column is missing
+        """
+        keys = ["BusinessUnitName", "AbsenceName"]
+        missing = [col for col in keys if col not in df.columns]
+        if missing:
+            raise ValidationError(f"Data missing columns for absence mapping: {missing}")
+
+        if df.empty:
+            return df.assign(AbsenceId=pd.Series(index=df.index, dtype=object))
+
+        if absence_index is None:
+            absence_index = build_absence_index(config_data)
+
+        codes, pairs = pd.MultiIndex.from_frame(df[keys]).factorize()
+        absence_ids = np.array(
+            [
+                None
+                if pd.isna(business_unit) or pd.isna(absence_name)
+                else map_absence_id(
+                    {"BusinessUnitName": business_unit, "AbsenceName": absence_name},
+                    config_data,
+                    absence_index,
+                )
+                for business_unit, absence_name in pairs
+            ],
+            dtype=object,
+        )
+
+        result_df = df.assign(AbsenceId=absence_ids[codes])
+        mapped = int(result_df["AbsenceId"].notna().sum())
+        logger.info(f"Mapped AbsenceId for {mapped}/{len(result_df)} records")
+
+        return result_df
+
     @staticmethod
     def standardize_column_types(df: pd.DataFrame) -> pd.DataFrame:
         """
         Standardize column data types for consistency.
 
+        Matching columns are stripped and lower-cased as STRING_DTYPE strings
+        (Arrow-backed when pyarrow is installed); CATEGORICAL_COLUMNS become
+        categoricals.
+
         Args:
             df: Input DataFrame
 
         Returns:
             DataFrame with standardized types
         """
-        df = df.copy()
+        columns = {}
 
         # String columns that should be lowercase for matching
-        lowercase_cols = ["WiserId", "EmploymentNumber", "AbsenceType", "AbsenceName"]
-        for col in lowercase_cols:
+        for col in LOWERCASE_COLUMNS:
             if col in df.columns:
-                df[col] = df[col].fillna("").astype(str).str.strip().str.lower()
+                columns[col] = df[col].astype(STRING_DTYPE).fillna("").str.strip().str.lower()
+
+        # Low-cardinality text columns: categoricals hash and compare integer codes
+        for col in CATEGORICAL_COLUMNS:
+            if col in df.columns:
+                columns[col] = columns.get(col, df[col]).astype("category")
 
         # Numeric columns
-        numeric_cols = [
-            "BalanceIn",
-            "Accrued",
-            "Extra",
-            "Units Approved",
-            "Beginning Year Balance",
-            "Accrued this year",
-        ]
-        for col in numeric_cols:
+        for col in NUMERIC_COLUMNS:
             if col in df.columns:
-                df[col] = pd.to_numeric(df[col], errors="coerce").fillna(0)
+                columns[col] = pd.to_numeric(df[col], errors="coerce").fillna(0)
 
         # Date columns
-        date_cols = ["StartDate", "EmploymentStartDate", "Latest Headcount Hire Date"]
-        for col in date_cols:
+        for col in DATE_COLUMNS:
             if col in df.columns:
-                df[col] = pd.to_datetime(df[col], errors="coerce")
+                columns[col] = pd.to_datetime(
+                    df[col], format=DATE_FORMAT, errors="coerce", cache=True
+                )
 
-        return df
+        # One assign builds the new frame instead of copying it and replacing columns
+        return df.assign(**columns)
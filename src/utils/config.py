@@ -1,14 +1,18 @@
 """Configuration management for the application."""
 
-import json
+import codecs
 import logging
 import os
+import sys
+from functools import cached_property, lru_cache
 from pathlib import Path
-from typing import Any, Dict
+from typing import Any, Dict, Optional, Tuple
 
 from dotenv import load_dotenv
 
 from ..utils.exceptions import ConfigurationError
+from ..utils.mappers import build_absence_index
+from ..utils.serialization import JSONDecodeError, loads
 
 # Load environment variables
 load_dotenv()
@@ -16,61 +20,189 @@ load_dotenv()
 logger = logging.getLogger(__name__)
 
 
+# Environment variables read by Config
+_ENV_KEYS = (
+    "CALABRIO_API_BASE_URL",
+    "CALABRIO_API_KEY",
+    "CALABRIO_API_SECRET",
+    "APP_ENV",
+    "APP_DEBUG",
+    "APP_PORT",
+    "DATA_DIR",
+    "CONFIG_DIR",
+    "LOG_LEVEL",
+    "LOG_FILE",
+    "JUPYTER_DASH_MODE",
+    "PANDAS_COPY_ON_WRITE",
+)
+
+
+# Settings that must be non-empty when APP_ENV is "production", checked in order
+_REQUIRED_IN_PRODUCTION = ("CALABRIO_API_BASE_URL", "CALABRIO_API_KEY", "CALABRIO_API_SECRET")
+
+
+# Values that turn a boolean setting on (compared case-insensitively)
+_TRUTHY = frozenset({"true", "1", "yes", "on", "t", "y"})
+
+
+@lru_cache(maxsize=8)
+def _parse_settings(env_values: Tuple[Optional[str], ...]) -> Dict[str, Any]:
+    """
+    Parse Config settings from the environment.
+
+    Cached on the values of _ENV_KEYS, so Config instances created with the
+    same environment share the parsing work. Callers must copy the result.
+
+    Args:
+        env_values: Values of _ENV_KEYS, in order (None when unset)
+
+    Returns:
+        Dict of Config attribute names to values
+    """
+    env = dict(zip(_ENV_KEYS, env_values))
+
+    def getenv(key: str, default: Any) -> Any:
+        value = env[key]
+        return default if value is None else value
+
+    settings: Dict[str, Any] = {}
+
+    # API Configuration
+    settings["CALABRIO_API_BASE_URL"] = getenv("CALABRIO_API_BASE_URL", "")
+    settings["CALABRIO_API_KEY"] = getenv("CALABRIO_API_KEY", "")
+    settings["CALABRIO_API_SECRET"] = getenv("CALABRIO_API_SECRET", "")
+
+    # Application Settings
+    settings["APP_ENV"] = getenv("APP_ENV", "development")
+    settings["APP_DEBUG"] = getenv("APP_DEBUG", "false").strip().lower() in _TRUTHY
+    settings["APP_PORT"] = int(getenv("APP_PORT", "8050"))
+
+    # Paths (files and subdirectories are derived lazily, see Config)
+    base_dir = settings["BASE_DIR"] = Path(__file__).parent.parent.parent
+    settings["DATA_DIR"] = Path(getenv("DATA_DIR", base_dir / "data"))
+    settings["CONFIG_DIR"] = Path(getenv("CONFIG_DIR", base_dir / "config"))
+
+    # Logging
+    settings["LOG_LEVEL"] = getenv("LOG_LEVEL", "INFO")
+    settings["LOG_FILE"] = getenv("LOG_FILE", "app.log")
+
+    # Jupyter/Colab
+    settings["JUPYTER_DASH_MODE"] = getenv("JUPYTER_DASH_MODE", "inline")
+
+    # Pandas copy-on-write (opt-in): derived frames (e.g. DataFrame.assign
+    # results) share column data with their source until one is modified.
+    # Off by default because it changes pandas semantics process-wide.
+    settings["PANDAS_COPY_ON_WRITE"] = (
+        getenv("PANDAS_COPY_ON_WRITE", "false").strip().lower() in _TRUTHY
+    )
+
+    return settings
+
+
+def _enable_copy_on_write() -> None:
+    """Turn on pandas copy-on-write without importing pandas here."""
+    pandas = sys.modules.get("pandas")
+    if pandas is not None:
+        pandas.set_option("mode.copy_on_write", True)
+    else:
+        # pandas reads this when it is first imported
+        os.environ["PANDAS_COPY_ON_WRITE"] = "1"
+
+
+def _looks_like_json(data: bytes) -> bool:
+    """Whether data starts like a JSON object or array, ignoring whitespace and a UTF-8 BOM."""
+    data = data.lstrip()
+    if data.startswith(codecs.BOM_UTF8):
+        data = data[len(codecs.BOM_UTF8) :].lstrip()
+    return data[:1] in (b"{", b"[")
+
+
 class Config:
     """Application configuration."""
 
+    # Settings, filled in from _parse_settings
+    CALABRIO_API_BASE_URL: str
+    CALABRIO_API_KEY: str
+    CALABRIO_API_SECRET: str
+    APP_ENV: str
+    APP_DEBUG: bool
+    APP_PORT: int
+    BASE_DIR: Path
+    DATA_DIR: Path
+    CONFIG_DIR: Path
+    LOG_LEVEL: str
+    LOG_FILE: str
+    JUPYTER_DASH_MODE: str
+    PANDAS_COPY_ON_WRITE: bool
+
     def __init__(self) -> None:
-        # API Configuration
-        self.CALABRIO_API_BASE_URL = os.getenv("CALABRIO_API_BASE_URL", "")
-        self.CALABRIO_API_KEY = os.getenv("CALABRIO_API_KEY", "")
-        self.CALABRIO_API_SECRET = os.getenv("CALABRIO_API_SECRET", "")
-
-        # Application Settings
-        self.APP_ENV = os.getenv("APP_ENV", "development")
-        self.APP_DEBUG = os.getenv("APP_DEBUG", "false").lower() == "true"
-        self.APP_PORT = int(os.getenv("APP_PORT", "8050"))
-
-        # Paths
-        self.BASE_DIR = Path(__file__).parent.parent.parent
-        self.DATA_DIR = Path(os.getenv("DATA_DIR", self.BASE_DIR / "data"))
-        self.CONFIG_DIR = Path(os.getenv("CONFIG_DIR", self.BASE_DIR / "config"))
-
-        # Data subdirectories
-        self.WORKDAY_DIR = self.DATA_DIR / "workday"
-        self.CALABRIO_DIR = self.DATA_DIR / "calabrio"
-        self.PERSON_ACCOUNTS_DIR = self.WORKDAY_DIR / "person_accounts"
-        self.PEOPLE_DIR = self.WORKDAY_DIR / "people"
-        self.USED_ENTRIES_DIR = self.WORKDAY_DIR / "used_entries"
-
-        # Calabrio data files
-        self.ACCOUNT_DATA_PATH = self.CALABRIO_DIR / "account_data.json"
-        self.PERSON_DATA_PATH = self.CALABRIO_DIR / "person_data.json"
-        self.CONFIG_DATA_PATH = self.CALABRIO_DIR / "config_data.json"
-
-        # Config files
-        self.BALANCE_RULES_PATH = self.CONFIG_DIR / "balance_rules.json"
-        self.CONTRACT_MAPPER_PATH = self.CONFIG_DIR / "contract_mapper.json"
-        self.TIMEZONE_MAPPER_PATH = self.CONFIG_DIR / "timezone_mapper.json"
-
-        # Logging
-        self.LOG_LEVEL = os.getenv("LOG_LEVEL", "INFO")
-        self.LOG_FILE = os.getenv("LOG_FILE", "app.log")
-
-        # Jupyter/Colab
-        self.JUPYTER_DASH_MODE = os.getenv("JUPYTER_DASH_MODE", "inline")
+        # Settings parsed from the environment (see _parse_settings)
+        self.__dict__.update(_parse_settings(tuple(os.environ.get(key) for key in _ENV_KEYS)))
+
+        if self.PANDAS_COPY_ON_WRITE:
+            _enable_copy_on_write()
+
+        # Parsed Calabrio configuration as (mtime, data), see get_calabrio_config
+        self._calabrio_config: Optional[Tuple[float, Dict[str, Any]]] = None
+        # Absence lookups as (config data, index), see get_absence_index
+        self._absence_index: Optional[Tuple[Dict[str, Any], Dict[str, Any]]] = None
 
         # Validate configuration
         self._validate()
 
+    # Data subdirectories
+    @cached_property
+    def WORKDAY_DIR(self) -> Path:
+        return self.DATA_DIR / "workday"
+
+    @cached_property
+    def CALABRIO_DIR(self) -> Path:
+        return self.DATA_DIR / "calabrio"
+
+    @cached_property
+    def PERSON_ACCOUNTS_DIR(self) -> Path:
+        return self.WORKDAY_DIR / "person_accounts"
+
+    @cached_property
+    def PEOPLE_DIR(self) -> Path:
+        return self.WORKDAY_DIR / "people"
+
+    @cached_property
+    def USED_ENTRIES_DIR(self) -> Path:
+        return self.WORKDAY_DIR / "used_entries"
+
+    # Calabrio data files
+    @cached_property
+    def ACCOUNT_DATA_PATH(self) -> Path:
+        return self.CALABRIO_DIR / "account_data.json"
+
+    @cached_property
+    def PERSON_DATA_PATH(self) -> Path:
+        return self.CALABRIO_DIR / "person_data.json"
+
+    @cached_property
+    def CONFIG_DATA_PATH(self) -> Path:
+        return self.CALABRIO_DIR / "config_data.json"
+
+    # Config files
+    @cached_property
+    def BALANCE_RULES_PATH(self) -> Path:
+        return self.CONFIG_DIR / "balance_rules.json"
+
+    @cached_property
+    def CONTRACT_MAPPER_PATH(self) -> Path:
+        return self.CONFIG_DIR / "contract_mapper.json"
+
+    @cached_property
+    def TIMEZONE_MAPPER_PATH(self) -> Path:
+        return self.CONFIG_DIR / "timezone_mapper.json"
+
     def _validate(self) -> None:
         """Validate configuration settings."""
         if self.APP_ENV == "production":
-            if not self.CALABRIO_API_BASE_URL:
-                raise ConfigurationError("CALABRIO_API_BASE_URL is required in production")
-            if not self.CALABRIO_API_KEY:
-                raise ConfigurationError("CALABRIO_API_KEY is required in production")
-            if not self.CALABRIO_API_SECRET:
-                raise ConfigurationError("CALABRIO_API_SECRET is required in production")
+            for name in _REQUIRED_IN_PRODUCTION:
+                if not getattr(self, name):
+                    raise ConfigurationError(f"{name} is required in production")
 
     def load_json_config(self, file_path: Path) -> Dict[str, Any]:
         """Load JSON configuration file."""
@@ -79,9 +211,13 @@ class Config:
                 logger.warning(f"Configuration file not found: {file_path}")
                 return {}
 
-            with open(file_path, "r", encoding="utf-8") as f:
-                return dict(json.load(f))
-        except json.JSONDecodeError as e:
+            data = file_path.read_bytes()
+            if not _looks_like_json(data):
+                raise ConfigurationError(f"Invalid JSON in {file_path}: not an object or array")
+            return dict(loads(data))
+        except ConfigurationError:
+            raise
+        except JSONDecodeError as e:
             raise ConfigurationError(f"Invalid JSON in {file_path}: {e}")
         except Exception as e:
             raise ConfigurationError(f"Error loading {file_path}: {e}")
@@ -99,8 +235,26 @@ class Config:
         return self.load_json_config(self.TIMEZONE_MAPPER_PATH)
 
     def get_calabrio_config(self) -> Dict[str, Any]:
-        """Get Calabrio configuration data."""
-        return self.load_json_config(self.CONFIG_DATA_PATH)
+        """
+        Get Calabrio configuration data.
+
+        The file is large, so it is parsed once and the same dictionary is
+        returned until the file's mtime changes. Callers must not modify it.
+        """
+        if not self.CONFIG_DATA_PATH.exists():
+            return self.load_json_config(self.CONFIG_DATA_PATH)
+
+        mtime = self.CONFIG_DATA_PATH.stat().st_mtime
+        if self._calabrio_config is None or self._calabrio_config[0] != mtime:
+            self._calabrio_config = (mtime, self.load_json_config(self.CONFIG_DATA_PATH))
+        return self._calabrio_config[1]
+
+    def get_absence_index(self) -> Dict[str, Any]:
+        """Get the map_absence_id lookups for the current Calabrio configuration."""
+        config_data = self.get_calabrio_config()
+        if self._absence_index is None or self._absence_index[0] is not config_data:
+            self._absence_index = (config_data, build_absence_index(config_data))
+        return self._absence_index[1]
 
     def setup_logging(self) -> None:
         """Set up logging configuration."""
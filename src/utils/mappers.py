@@ -1,7 +1,9 @@
 """Mapping utilities for business units and other entities."""
 
 import logging
-from typing import Any, Dict, Optional
+import re
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Tuple
 
 logger = logging.getLogger(__name__)
 
@@ -32,11 +34,26 @@ BUSINESS_UNIT_MAPPING = {
     "global - marketing": "Marketing",
 }
 
+# Prefixes stripped before retrying the exact mapping
+BUSINESS_UNIT_PREFIXES = ("global -", "global_", "global")
 
+# Mapping items in order, for the partial-match scan
+_BUSINESS_UNIT_ITEMS = tuple(BUSINESS_UNIT_MAPPING.items())
+
+# Prefilters for the partial-match scan: a name can only match if some key
+# occurs in it or it occurs in some key
+_BUSINESS_UNIT_KEY_PATTERN = re.compile("|".join(map(re.escape, BUSINESS_UNIT_MAPPING)))
+_BUSINESS_UNIT_KEYS_JOINED = "\n".join(BUSINESS_UNIT_MAPPING)
+
+
+@lru_cache(maxsize=512)
 def map_business_unit(business_unit: Optional[str]) -> Optional[str]:
     """
     Map business unit names to standardized format.
 
+    Results are cached per name, since the same few business units repeat
+    across many rows.
+
     Args:
         business_unit: The business unit name to map
 
@@ -52,30 +69,76 @@ def map_business_unit(business_unit: Optional[str]) -> Optional[str]:
         return BUSINESS_UNIT_MAPPING[bu_lower]
 
     # Try removing common prefixes
-    prefixes = ["global -", "global_", "global"]
-    for prefix in prefixes:
+    for prefix in BUSINESS_UNIT_PREFIXES:
         if bu_lower.startswith(prefix):
             cleaned = bu_lower[len(prefix) :].strip()
             if cleaned in BUSINESS_UNIT_MAPPING:
                 return BUSINESS_UNIT_MAPPING[cleaned]
 
-    # Try partial matching
-    for key, value in BUSINESS_UNIT_MAPPING.items():
-        if key in bu_lower or bu_lower in key:
-            return value
+    # Try partial matching, first mapping entry wins
+    if _BUSINESS_UNIT_KEY_PATTERN.search(bu_lower) or bu_lower in _BUSINESS_UNIT_KEYS_JOINED:
+        for key, value in _BUSINESS_UNIT_ITEMS:
+            if key in bu_lower or bu_lower in key:
+                return value
 
     # Return original if no mapping found
     logger.debug(f"No mapping found for business unit: {business_unit}")
     return business_unit
 
 
-def map_absence_id(row: Dict[str, Any], config_data: Dict[str, Any]) -> Optional[str]:
+def _index_absences(absences: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """
+    Build the name lookups for one business unit's absences.
+
+    Args:
+        absences: Absence dicts from config_data[business_unit]["absences"]["Result"]
+
+    Returns:
+        Dict with "exact" and "lower" name -> Id maps (first occurrence wins) and
+        "names_lower", the (lower-cased name, Id) pairs in config order
+    """
+    exact: Dict[Any, str] = {}
+    lower: Dict[str, str] = {}
+    names_lower: List[Tuple[str, str]] = []
+    for absence in absences:
+        absence_id = str(absence.get("Id", ""))
+        name_lower = (absence.get("Name") or "").lower()
+        exact.setdefault(absence.get("Name"), absence_id)
+        lower.setdefault(name_lower, absence_id)
+        names_lower.append((name_lower, absence_id))
+    return {"exact": exact, "lower": lower, "names_lower": names_lower}
+
+
+def build_absence_index(config_data: Dict[str, Any]) -> Dict[str, Dict[str, Any]]:
+    """
+    Build absence name lookups for every business unit in config_data.
+
+    Args:
+        config_data: Configuration data dictionary
+
+    Returns:
+        Dict mapping business unit to its lookups, for map_absence_id
+    """
+    return {
+        business_unit: _index_absences(bu_config.get("absences", {}).get("Result", []))
+        for business_unit, bu_config in config_data.items()
+        if isinstance(bu_config, dict)
+    }
+
+
+def map_absence_id(
+    row: Dict[str, Any],
+    config_data: Dict[str, Any],
+    absence_index: Optional[Dict[str, Dict[str, Any]]] = None,
+) -> Optional[str]:
     """
     Retrieves AbsenceId from config_data using BusinessUnitName and AbsenceName.
 
     Args:
         row: Dictionary containing BusinessUnitName and AbsenceName
         config_data: Configuration data dictionary
+        absence_index: Lookups from build_absence_index(config_data); business
+            units missing from it are indexed on first use and added to it
 
     Returns:
         AbsenceId if found, None otherwise
@@ -95,31 +158,33 @@ def map_absence_id(row: Dict[str, Any], config_data: Dict[str, Any]) -> Optional
             return None
         business_unit = mapped_bu
 
-    # Get absences list
-    absences = config_data.get(business_unit, {}).get("absences", {}).get("Result", [])
+    # Get absence lookups
+    if absence_index is None:
+        absence_index = {}
+    index = absence_index.get(business_unit)
+    if index is None:
+        absences = config_data.get(business_unit, {}).get("absences", {}).get("Result", [])
+        index = absence_index[business_unit] = _index_absences(absences)
 
     # Attempt exact match
-    for absence in absences:
-        if absence.get("Name") == absence_name:
-            return str(absence.get("Id", ""))
+    if absence_name in index["exact"]:
+        return index["exact"][absence_name]
 
     # Attempt case-insensitive match
     absence_name_lower = absence_name.lower()
-    for absence in absences:
-        if absence.get("Name", "").lower() == absence_name_lower:
-            return str(absence.get("Id", ""))
+    if absence_name_lower in index["lower"]:
+        return index["lower"][absence_name_lower]
 
     # Attempt partial match
-    for absence in absences:
-        if absence_name_lower in absence.get("Name", "").lower():
-            return str(absence.get("Id", ""))
+    for name_lower, absence_id in index["names_lower"]:
+        if absence_name_lower in name_lower:
+            return absence_id
 
     # Retry by adding 'Global -' prefix
-    if not absence_name.lower().startswith("global -"):
+    if not absence_name_lower.startswith("global -"):
         global_absence = f"Global - {absence_name}"
-        for absence in absences:
-            if absence.get("Name") == global_absence:
-                return str(absence.get("Id", ""))
+        if global_absence in index["exact"]:
+            return index["exact"][global_absence]
 
     logger.debug(f"No absence ID found for: {business_unit} - {absence_name}")
     return None
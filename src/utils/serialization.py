@@ -0,0 +1,68 @@
+"""JSON parsing helpers that use orjson when it is installed."""
+
+import json
+from json import JSONDecodeError
+from pathlib import Path
+from typing import Any, List, Union
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def loads(data: Union[bytes, str]) -> Any:
+    """
+    Parse a JSON document.
+
+    Uses orjson when available and falls back to the standard library for
+    input orjson rejects but json accepts, such as NaN.
+
+    Args:
+        data: JSON document as bytes or str
+
+    Returns:
+        The parsed Python object
+
+    Raises:
+        JSONDecodeError: If the document is not valid JSON
+    """
+    if orjson is not None:
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            pass
+    return json.loads(data)
+
+
+def load_json(file_path: Path) -> Any:
+    """
+    Read and parse a JSON file.
+
+    Args:
+        file_path: Path to the JSON file
+
+    Returns:
+        The parsed Python object
+
+    Raises:
+        JSONDecodeError: If the file is not valid JSON
+    """
+    return loads(Path(file_path).read_bytes())
+
+
+def load_json_lines(file_path: Path) -> List[Any]:
+    """
+    Read and parse a JSON Lines file (one JSON document per line).
+
+    Args:
+        file_path: Path to the JSON Lines file
+
+    Returns:
+        The parsed documents, skipping blank lines
+
+    Raises:
+        JSONDecodeError: If a line is not valid JSON
+    """
+    with open(file_path, "rb") as f:
+        return [loads(line) for line in f if line.strip()]
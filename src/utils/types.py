@@ -3,10 +3,21 @@
 from dataclasses import dataclass
 from datetime import datetime
 from enum import Enum
-from typing import Dict, List, Optional, Union
+from typing import Any, Dict, List, Optional, Union
 
 from pydantic import BaseModel, Field
 
+try:
+    import pyarrow  # noqa: F401
+
+    # Arrow-backed strings: vectorized .str methods and C++ hashing in merges
+    STRING_DTYPE = "string[pyarrow]"
+except ImportError:
+    STRING_DTYPE = "string"
+
+# Dates in the Workday and Calabrio exports are ISO 8601, with or without a time part
+DATE_FORMAT = "ISO8601"
+
 
 class AbsenceType(str, Enum):
     """Enumeration of absence types."""
@@ -45,6 +56,58 @@ class ColumnMapping:
     required: bool = True
 
 
+@dataclass(frozen=True)
+class AbsenceRule:
+    """Balance rule for one absence type, with defaults resolved."""
+
+    calculation_method: str = "standard"
+    fixed_balance: float = 0.0
+    fixed_accrual: float = 0.0
+    max_carryover: float = float("inf")
+    accrual_rate: float = 0.0
+    prorate_first_year: bool = False
+    formula: str = ""
+
+    @classmethod
+    def from_config(cls, config: Dict[str, Any]) -> "AbsenceRule":
+        """Build a rule from an "absence_rules" entry of the rules file."""
+        return cls(
+            calculation_method=config.get("calculation_method", "standard"),
+            fixed_balance=float(config.get("fixed_balance", 0)),
+            fixed_accrual=float(config.get("fixed_accrual", 0)),
+            max_carryover=float(config.get("max_carryover", float("inf"))),
+            accrual_rate=float(config.get("accrual_rate", 0)),
+            prorate_first_year=bool(config.get("prorate_first_year", False)),
+            formula=config.get("formula", "") or "",
+        )
+
+
+@dataclass(frozen=True)
+class GlobalSettings:
+    """Global balance settings and default values, with defaults resolved."""
+
+    min_balance: float = 0
+    max_balance: float = 999
+    max_accrual: float = 999
+    round_to_nearest: float = 1
+    beginning_year_balance: float = 0
+    accrued_this_year: float = 0
+
+    @classmethod
+    def from_config(cls, rules: Dict[str, Any]) -> "GlobalSettings":
+        """Build settings from the "global_settings" and "default_values" of the rules file."""
+        settings = rules.get("global_settings", {})
+        defaults = rules.get("default_values", {})
+        return cls(
+            min_balance=settings.get("min_balance", 0),
+            max_balance=settings.get("max_balance", 999),
+            max_accrual=settings.get("max_accrual", 999),
+            round_to_nearest=settings.get("round_to_nearest", 1),
+            beginning_year_balance=defaults.get("beginning_year_balance", 0),
+            accrued_this_year=defaults.get("accrued_this_year", 0),
+        )
+
+
 class PersonData(BaseModel):
     """Person data model."""
 
@@ -0,0 +1,148 @@
+"""Unit tests for balance calculation functionality."""
+
+import json
+import os
+from datetime import datetime
+from pathlib import Path
+
+import pandas as pd
+import pytest
+
+from src.core.calculator import BalanceCalculator
+from src.utils.exceptions import CalculationError, ConfigurationError
+
+
+@pytest.fixture
+def calculator(tmp_path, balance_rules) -> BalanceCalculator:
+    """Create a calculator with lower-cased sample rules and global limits."""
+    rules = {
+        "default_values": balance_rules["default_values"],
+        "absence_rules": {
+            key.lower(): value for key, value in balance_rules["absence_rules"].items()
+        },
+        "global_settings": {"round_to_nearest": 1, "min_balance": 0, "max_balance": 30},
+    }
+    rules["absence_rules"]["annual leave"]["prorate_first_year"] = True
+    rules_file = tmp_path / "balance_rules.json"
+    rules_file.write_text(json.dumps(rules))
+    return BalanceCalculator(rules_file)
+
+
+class TestComputeFrame:
+    """Test cases for BalanceCalculator.compute_frame."""
+
+    @pytest.mark.parametrize("to_dates", [list, pd.to_datetime], ids=["strings", "datetimes"])
+    def test_matches_row_wise_calculation(self, calculator, sample_workday_data, to_dates):
+        """Test that compute_frame agrees with calculate_correct_values per row."""
+        this_year = datetime.now().year
+        df = sample_workday_data.assign(
+            **{
+                "Beginning Year Balance": [55.0, -3.0, 12.5],
+                "Latest Headcount Hire Date": to_dates([None, None, f"{this_year}-10-01"]),
+                "EmploymentStartDate": to_dates([f"{this_year}-06-01", None, "2021-03-20"]),
+            }
+        )
+
+        balance, accrual = calculator.compute_frame(df)
+
+        for i, row in enumerate(df.to_dict("records")):
+            expected = calculator.calculate_correct_values(row, row["AbsenceType"])
+            assert (balance.iloc[i], accrual.iloc[i]) == pytest.approx(expected)
+
+    def test_applies_rules_by_absence_type(self, calculator, sample_workday_data):
+        """Test standard and fixed rules resolved per absence type."""
+        balance, accrual = calculator.compute_frame(sample_workday_data)
+
+        assert balance.tolist() == [10.0, 5.0, 15.0]
+        assert accrual.tolist() == [12.0, 0.0, 8.0]
+        assert balance.index.equals(sample_workday_data.index)
+
+    def test_uses_defaults_without_rules_file(self, sample_workday_data):
+        """Test vectorized calculation with the built-in default rules."""
+        calculator = BalanceCalculator(Path("nonexistent_rules.json"))
+
+        balance, accrual = calculator.compute_frame(sample_workday_data)
+
+        assert balance.tolist() == [10.0, 5.0, 15.0]
+        assert accrual.tolist() == [12.0, 0.0, 8.0]
+
+    def test_custom_absence_type_column(self, calculator):
+        """Test reading absence types from another column."""
+        df = pd.DataFrame(
+            {"Workday Absence Type": ["Sick Leave"], "Beginning Year Balance": [1.0]}
+        )
+
+        balance, accrual = calculator.compute_frame(df, "Workday Absence Type")
+
+        assert balance.tolist() == [5.0]
+        assert accrual.tolist() == [0.0]
+
+    def test_invalid_values_raise_calculation_error(self, calculator):
+        """Test that non-numeric balances raise CalculationError."""
+        df = pd.DataFrame({"AbsenceType": ["Annual Leave"], "Beginning Year Balance": ["abc"]})
+
+        with pytest.raises(CalculationError):
+            calculator.compute_frame(df)
+
+
+class TestProrateAccrual:
+    """Test cases for BalanceCalculator._prorate_accrual."""
+
+    def test_prorates_hires_in_current_year(self, calculator):
+        """Test that hires in the current year earn accrual per month employed."""
+        hire_date = f"{calculator.current_year}-10-01"
+
+        assert calculator._prorate_accrual(hire_date, 20.0, 2.0) == 6.0
+        assert calculator._prorate_accrual(pd.Timestamp(hire_date), 20.0, 2.0) == 6.0
+
+    def test_earlier_or_invalid_hire_dates_get_full_accrual(self, calculator):
+        """Test full accrual for earlier and unparseable hire dates."""
+        assert calculator._prorate_accrual("2000-01-15", 20.0, 2.0) == 20.0
+        assert calculator._prorate_accrual("not a date", 20.0, 2.0) == 20.0
+        assert calculator._prorate_accrual(None, 20.0, 2.0) == 20.0
+
+
+class TestLoadRules:
+    """Test cases for BalanceCalculator rule loading."""
+
+    def test_load_rules_rebuilds_compiled_rules(self, calculator):
+        """Test that _load_rules rebuilds the compiled per-absence rules."""
+        assert calculator._get_absence_rules("annual leave").prorate_first_year is True
+
+        calculator.rules_file = Path("nonexistent_rules.json")
+        calculator.rules = calculator._load_rules()
+
+        assert calculator._get_absence_rules("annual leave").prorate_first_year is False
+
+    def test_unknown_absence_type_uses_default_rule(self, tmp_path):
+        """Test fallback to the "default" absence rule."""
+        rules_file = tmp_path / "balance_rules.json"
+        default_rule = {"calculation_method": "fixed", "fixed_balance": 7}
+        rules_file.write_text(json.dumps({"absence_rules": {"default": default_rule}}))
+        calculator = BalanceCalculator(rules_file)
+
+        assert calculator.calculate_correct_values({}, "Unknown Leave") == (7.0, 0.0)
+
+    def test_invalid_rule_value_raises_configuration_error(self, tmp_path):
+        """Test that non-numeric rule values are rejected at load time."""
+        rules_file = tmp_path / "balance_rules.json"
+        invalid_rule = {"max_carryover": "x"}
+        rules_file.write_text(json.dumps({"absence_rules": {"annual leave": invalid_rule}}))
+
+        with pytest.raises(ConfigurationError):
+            BalanceCalculator(rules_file)
+
+    def test_parsed_rules_reused_until_file_changes(self, tmp_path):
+        """Test that rules files are parsed once per mtime and copied per instance."""
+        rules_file = tmp_path / "balance_rules.json"
+        rules_file.write_text(json.dumps({"global_settings": {"max_balance": 10}}))
+
+        first = BalanceCalculator(rules_file)
+        first.rules["global_settings"]["max_balance"] = 0
+        assert BalanceCalculator(rules_file).rules["global_settings"]["max_balance"] == 10
+
+        rules_file.write_text(json.dumps({"global_settings": {"max_balance": 20}}))
+        mtime = rules_file.stat().st_mtime + 1
+        os.utime(rules_file, (mtime, mtime))
+
+        assert BalanceCalculator(rules_file).rules["global_settings"]["max_balance"] == 20
@@ -1,7 +1,10 @@
 """Unit tests for configuration management."""
 
+import os
+import sys
 from pathlib import Path
 
+import pandas as pd
 import pytest
 
 from src.utils.config import Config
@@ -44,6 +47,16 @@ class TestConfig:
 
         assert "CALABRIO_API_BASE_URL is required" in str(exc_info.value)
 
+    def test_production_validation_checks_each_setting(self, monkeypatch):
+        """Test that each required production setting is checked."""
+        monkeypatch.setenv("APP_ENV", "production")
+        monkeypatch.setenv("CALABRIO_API_BASE_URL", "https://api.example.com")
+        monkeypatch.setenv("CALABRIO_API_KEY", "key")
+        monkeypatch.setenv("CALABRIO_API_SECRET", "")
+
+        with pytest.raises(ConfigurationError, match="CALABRIO_API_SECRET is required"):
+            Config()
+
     def test_path_configuration(self, env_setup):
         """Test path configuration."""
         config = Config()
@@ -85,6 +98,36 @@ class TestConfig:
 
         assert "Invalid JSON" in str(exc_info.value)
 
+    def test_load_json_config_rejects_non_json_without_parsing(self, tmp_path):
+        """Test that files not starting with { or [ are rejected before parsing."""
+        test_file = tmp_path / "config.json"
+        test_file.write_text("key = value")
+        bom_file = tmp_path / "bom.json"
+        bom_file.write_bytes(b'\xef\xbb\xbf {"key": "value"}')
+
+        config = Config()
+
+        with pytest.raises(ConfigurationError, match="Invalid JSON"):
+            config.load_json_config(test_file)
+        assert config.load_json_config(bom_file) == {"key": "value"}
+
+    def test_calabrio_config_parsed_once_per_mtime(self, monkeypatch, tmp_path):
+        """Test that the Calabrio config is reused until the file changes."""
+        monkeypatch.setenv("DATA_DIR", str(tmp_path))
+        config_file = tmp_path / "calabrio" / "config_data.json"
+        config_file.parent.mkdir()
+        config_file.write_text('{"bus": []}')
+
+        config = Config()
+        first = config.get_calabrio_config()
+        assert config.get_calabrio_config() is first
+
+        config_file.write_text('{"bus": [], "FinCrime": {}}')
+        mtime = config_file.stat().st_mtime + 1
+        os.utime(config_file, (mtime, mtime))
+
+        assert config.get_calabrio_config() == {"bus": [], "FinCrime": {}}
+
     def test_debug_mode(self, monkeypatch):
         """Test debug mode configuration."""
         monkeypatch.setenv("APP_DEBUG", "true")
@@ -99,6 +142,49 @@ class TestConfig:
         config = Config()
         assert config.APP_DEBUG is True
 
+    def test_boolean_settings_accept_common_truthy_values(self, monkeypatch):
+        """Test that booleans accept values such as "1", "yes" and " On "."""
+        for value in ["1", "yes", " On ", "y"]:
+            monkeypatch.setenv("APP_DEBUG", value)
+            assert Config().APP_DEBUG is True
+
+        for value in ["0", "no", "", "off"]:
+            monkeypatch.setenv("APP_DEBUG", value)
+            assert Config().APP_DEBUG is False
+
+    def test_settings_parsed_once_per_environment(self, monkeypatch):
+        """Test that instances share parsed settings until the environment changes."""
+        monkeypatch.setenv("APP_PORT", "9000")
+        first = Config()
+        second = Config()
+
+        monkeypatch.setenv("APP_PORT", "9001")
+        third = Config()
+
+        assert first.DATA_DIR is second.DATA_DIR
+        assert second.APP_PORT == 9000
+        assert third.APP_PORT == 9001
+
+    def test_copy_on_write_is_opt_in(self, monkeypatch):
+        """Test that creating a Config leaves pandas copy-on-write alone by default."""
+        monkeypatch.delenv("PANDAS_COPY_ON_WRITE", raising=False)
+
+        with pd.option_context("mode.copy_on_write", False):
+            assert Config().PANDAS_COPY_ON_WRITE is False
+            assert pd.get_option("mode.copy_on_write") is False
+
+        assert "PANDAS_COPY_ON_WRITE" not in os.environ
+
+    def test_copy_on_write_without_importing_pandas(self, monkeypatch):
+        """Test that copy-on-write is requested through pandas' own environment variable."""
+        monkeypatch.delitem(sys.modules, "pandas")
+        monkeypatch.setenv("PANDAS_COPY_ON_WRITE", "true")
+
+        Config()
+
+        assert "pandas" not in sys.modules
+        assert os.environ["PANDAS_COPY_ON_WRITE"] == "1"
+
     def test_custom_paths(self, monkeypatch, tmp_path):
         """Test custom path configuration."""
         custom_data = tmp_path / "custom_data"
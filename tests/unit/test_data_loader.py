@@ -1,13 +1,20 @@
 """Unit tests for data loading functionality."""
 
 import json
+import os
 from pathlib import Path
 
 import pandas as pd
 import pytest
 from openpyxl import Workbook
 
-from src.core.data_loader import CalabrioDataLoader, DataLoader, WorkdayDataLoader
+from src.core.data_loader import (
+    CalabrioDataLoader,
+    DataLoader,
+    WorkdayDataLoader,
+    _key_column,
+    _run_concurrently,
+)
 from src.utils.exceptions import DataLoadError
 
 
@@ -66,6 +73,8 @@ class TestDataLoader:
 
     def test_load_excel_files_no_files(self, tmp_path):
         """Test loading when no Excel files exist."""
+        (tmp_path / "archive.xlsx").mkdir()
+
         result = DataLoader.load_excel_files(tmp_path)
 
         assert result.empty
@@ -78,15 +87,48 @@ class TestDataLoader:
             test_df = pd.DataFrame({"value": [i]})
             test_df.to_excel(excel_file, index=False)
             # Ensure different timestamps
-            import time
-
-            time.sleep(0.01)
+            os.utime(excel_file, (1_700_000_000 + i, 1_700_000_000 + i))
 
         # Load and verify latest file is used
         result = DataLoader.load_excel_files(tmp_path)
 
         assert result["value"].iloc[0] == 2  # Latest file should have value 2
 
+    def test_load_excel_sheets(self, tmp_path):
+        """Test reading several sheets from the latest Excel file."""
+        with pd.ExcelWriter(tmp_path / "workbook.xlsx") as writer:
+            pd.DataFrame({"value": [1, 2]}).to_excel(writer, sheet_name="First", index=False)
+            pd.DataFrame({"name": ["a"]}).to_excel(writer, sheet_name="Second", index=False)
+
+        result = DataLoader.load_excel_sheets(tmp_path, ["Second", "First"])
+
+        assert list(result) == ["Second", "First"]
+        assert result["First"]["value"].tolist() == [1, 2]
+        assert result["Second"]["name"].tolist() == ["a"]
+
+        with pytest.raises(DataLoadError):
+            DataLoader.load_excel_sheets(tmp_path, ["Missing"])
+
+    def test_latest_file_is_cached_until_directory_changes(self, tmp_path, monkeypatch):
+        """Test that the directory is only rescanned after a file is added."""
+        pd.DataFrame({"value": [1]}).to_excel(tmp_path / "first.xlsx", index=False)
+        DataLoader.load_excel_files(tmp_path)
+
+        scanned = []
+        original_scandir = os.scandir
+        monkeypatch.setattr(
+            os, "scandir", lambda path: scanned.append(path) or original_scandir(path)
+        )
+
+        assert DataLoader.load_excel_files(tmp_path)["value"].iloc[0] == 1
+        assert scanned == []
+
+        pd.DataFrame({"value": [2]}).to_excel(tmp_path / "second.xlsx", index=False)
+        os.utime(tmp_path, (0, 0))
+
+        assert DataLoader.load_excel_files(tmp_path)["value"].iloc[0] == 2
+        assert scanned == [tmp_path]
+
     def test_load_json_file_success(self, tmp_path):
         """Test successful JSON file loading."""
         # Create test JSON file
@@ -101,6 +143,43 @@ class TestDataLoader:
         assert "id" in result.columns
         assert "name" in result.columns
 
+    def test_load_json_file_with_nan_values(self, tmp_path):
+        """Test loading JSON with bare NaN values, as found in Calabrio exports."""
+        json_file = tmp_path / "nan_data.json"
+        json_file.write_text('[{"id": 1, "balance": NaN}, {"id": 2, "balance": 3.5}]')
+
+        result = DataLoader.load_json_file(json_file)
+
+        assert result["balance"].isna().tolist() == [True, False]
+
+    def test_load_json_bytes(self):
+        """Test building a DataFrame from an in-memory JSON document."""
+        records = DataLoader.load_json_bytes(b'[{"id": 1, "balance": NaN}, {"id": 2}]')
+        columns = DataLoader.load_json_bytes('{"id": [1, 2]}')
+        scalars = DataLoader.load_json_bytes(b"[1, 2, 3]")
+
+        assert records["id"].tolist() == [1, 2]
+        assert records["balance"].isna().all()
+        assert columns["id"].tolist() == [1, 2]
+        assert scalars[0].tolist() == [1, 2, 3]
+
+    def test_load_json_lines_file(self, tmp_path):
+        """Test loading a JSON Lines file, including lines pyarrow rejects."""
+        jsonl_file = tmp_path / "records.jsonl"
+        jsonl_file.write_text('{"id": 1, "name": "Alice"}\n{"id": 2, "name": "Bob"}\n')
+        nan_file = tmp_path / "nan_records.ndjson"
+        nan_file.write_text('{"id": 1, "balance": NaN}\n\n{"id": 2, "balance": 3.5}\n')
+        scalar_file = tmp_path / "scalars.jsonl"
+        scalar_file.write_text("1\n2\n")
+
+        result = DataLoader.load_json_file(jsonl_file)
+        nan_result = DataLoader.load_json_file(nan_file)
+
+        assert result["id"].tolist() == [1, 2]
+        assert result["name"].tolist() == ["Alice", "Bob"]
+        assert nan_result["balance"].isna().tolist() == [True, False]
+        assert DataLoader.load_json_file(scalar_file)[0].tolist() == [1, 2]
+
     def test_load_json_file_not_exists(self):
         """Test loading non-existent JSON file."""
         with pytest.raises(DataLoadError) as exc_info:
@@ -119,6 +198,64 @@ class TestDataLoader:
         assert "Invalid JSON" in str(exc_info.value)
 
 
+class TestKeyColumn:
+    """Test cases for _key_column."""
+
+    def test_numeric_ids_become_int64(self):
+        """Test that whole-number and numeric-string IDs become Int64."""
+        floats = _key_column(pd.Series([12345.0, None, 67890.0]))
+        strings = _key_column(pd.Series(["12345", None, "67890"]))
+
+        assert floats.dtype == "Int64"
+        assert strings.dtype == "Int64"
+        assert strings.tolist() == [12345, pd.NA, 67890]
+
+    def test_other_ids_stay_strings(self):
+        """Test that text, blank and zero-padded IDs keep their string values."""
+        mixed = _key_column(pd.Series(["AB12", 345], dtype=object))
+        padded = _key_column(pd.Series(["00123", "", "456"]))
+
+        assert mixed.tolist() == ["AB12", "345"]
+        assert padded.tolist() == ["00123", "", "456"]
+
+
+class TestRunConcurrently:
+    """Test cases for _run_concurrently."""
+
+    def test_returns_results_in_order(self):
+        """Test that results come back in loader order."""
+        first, second = pd.DataFrame({"a": [1]}), pd.DataFrame({"b": [2]})
+
+        result = _run_concurrently([lambda: first, lambda: second])
+
+        assert result[0] is first
+        assert result[1] is second
+
+    def test_failure_is_raised_after_all_loaders_finish(self):
+        """Test that one failing loader does not stop the others."""
+        finished = []
+
+        def failing_loader():
+            raise RuntimeError("boom")
+
+        def other_loader():
+            finished.append(True)
+            return pd.DataFrame()
+
+        with pytest.raises(RuntimeError, match="boom"):
+            _run_concurrently([failing_loader, other_loader])
+
+        assert finished == [True]
+
+    def test_failing_partial_loader(self, tmp_path):
+        """Test that loaders without a __name__ report their own error."""
+        loader = WorkdayDataLoader(tmp_path, tmp_path, tmp_path)
+        loader.loader = None  # Any use of the DataLoader fails
+
+        with pytest.raises(AttributeError, match="load_excel_files"):
+            loader.load_all_data()
+
+
 class TestWorkdayDataLoader:
     """Test cases for WorkdayDataLoader class."""
 
@@ -171,7 +308,7 @@ class TestWorkdayDataLoader:
         assert len(workday_df) == 2
         assert len(people_df) == 2
         assert len(used_entries_df) == 1
-        assert workday_df["WiserId"].dtype == "object"  # String type
+        assert workday_df["WiserId"].dtype == "Int64"  # Numeric IDs
         assert "WiserId" in people_df.columns  # Column renamed
         assert pd.api.types.is_datetime64_any_dtype(people_df["Latest Headcount Hire Date"])
 
@@ -195,11 +332,12 @@ class TestCalabrioDataLoader:
         """Test loading all Calabrio data."""
         # Create test JSON files
         account_data = [
-            {"EmploymentNumber": "123", "Accrued": "10.5", "BalanceIn": 20},
+            {"EmploymentNumber": "123", "Accrued": "10.5", "BalanceIn": 20, "Extra": None},
             {
                 "EmploymentNumber": "456",
                 "Accrued": "invalid",  # Test error handling
                 "BalanceIn": 30,
+                "Extra": "2",
             },
         ]
         person_data = [
@@ -220,9 +358,11 @@ class TestCalabrioDataLoader:
         # Verify
         assert len(calabrio_df) == 2
         assert len(person_df) == 2
-        assert calabrio_df["EmploymentNumber"].dtype == "object"  # String type
+        assert calabrio_df["EmploymentNumber"].dtype == "Int64"  # Numeric IDs
         assert calabrio_df.loc[0, "Accrued"] == 10.5
         assert calabrio_df.loc[1, "Accrued"] == 0  # Invalid value becomes 0
+        assert calabrio_df["Extra"].tolist() == [0, 2]
+        assert calabrio_df["BalanceIn"].tolist() == [20, 30]
         assert pd.api.types.is_datetime64_any_dtype(person_df["EmploymentStartDate"])
 
     def test_load_with_missing_files(self, tmp_path):
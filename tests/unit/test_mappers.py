@@ -0,0 +1,66 @@
+"""Unit tests for mapping utilities."""
+
+from src.utils.mappers import build_absence_index, map_absence_id, map_business_unit
+
+
+class TestMapBusinessUnit:
+    """Test cases for map_business_unit."""
+
+    def test_maps_known_names_and_prefixes(self):
+        """Test exact, prefixed and partial business unit matches."""
+        assert map_business_unit(" Customer Care ") == "Customer Care"
+        assert map_business_unit("Global_IT") == "IT"
+        assert map_business_unit("Global Finance") == "Finance"
+        assert map_business_unit("EU Collections Team") == "Collections"
+
+    def test_unknown_and_empty_names(self):
+        """Test that unknown names are returned unchanged and empty ones as None."""
+        assert map_business_unit("FinCrime") == "FinCrime"
+        assert map_business_unit("") is None
+        assert map_business_unit(None) is None
+
+    def test_results_are_cached(self):
+        """Test that repeated names are served from the cache."""
+        map_business_unit.cache_clear()
+
+        map_business_unit("Global - HR")
+        map_business_unit("Global - HR")
+
+        assert map_business_unit.cache_info().hits == 1
+
+
+class TestMapAbsenceId:
+    """Test cases for map_absence_id."""
+
+    def test_match_order(self, sample_config_data):
+        """Test exact, case-insensitive, partial and 'Global -' matches."""
+        sample_config_data["Unit A"]["absences"]["Result"].append(
+            {"Id": "ABS005", "Name": "Global - Jury Duty"}
+        )
+
+        def lookup(name):
+            row = {"BusinessUnitName": "Unit A", "AbsenceName": name}
+            return map_absence_id(row, sample_config_data)
+
+        assert lookup("Annual Leave") == "ABS001"
+        assert lookup("SICK LEAVE") == "ABS002"
+        assert lookup("leave") == "ABS001"
+        assert lookup("Jury Duty") == "ABS005"
+        assert lookup("Parental Leave") is None
+
+    def test_uses_prebuilt_index(self, sample_config_data):
+        """Test lookups through build_absence_index without rescanning the config."""
+        absence_index = build_absence_index(sample_config_data)
+        sample_config_data["Unit B"]["absences"]["Result"].clear()
+
+        row = {"BusinessUnitName": "Unit B", "AbsenceName": "sick leave"}
+
+        assert map_absence_id(row, sample_config_data, absence_index) == "ABS004"
+        assert map_absence_id(row, sample_config_data) is None
+
+    def test_unknown_business_unit(self, sample_config_data):
+        """Test that unknown business units and missing fields map to None."""
+        row = {"BusinessUnitName": "Unit Z", "AbsenceName": "Annual Leave"}
+
+        assert map_absence_id(row, sample_config_data) is None
+        assert map_absence_id({"BusinessUnitName": "Unit A"}, sample_config_data) is None
@@ -0,0 +1,142 @@
+"""Unit tests for data preprocessing functionality."""
+
+import pandas as pd
+import pytest
+
+from src.core.preprocessor import DataPreprocessor
+from src.utils.exceptions import ValidationError
+
+
+class TestStandardizeColumnTypes:
+    """Test cases for DataPreprocessor.standardize_column_types."""
+
+    def test_normalizes_matching_columns(self):
+        """Test that matching columns are stripped and lower-cased strings."""
+        df = pd.DataFrame(
+            {"WiserId": [" AB12 ", None, 345], "AbsenceType": ["Annual Leave", "", None]}
+        )
+
+        result = DataPreprocessor.standardize_column_types(df)
+
+        assert result["WiserId"].tolist() == ["ab12", "", "345"]
+        assert result["AbsenceType"].tolist() == ["annual leave", "", ""]
+        assert df["WiserId"].iloc[0] == " AB12 "
+
+    def test_input_is_not_modified_with_copy_on_write(self):
+        """Test that the input frame is untouched when copy-on-write is enabled."""
+        df = pd.DataFrame({"AbsenceType": [" Sick "], "Extra": ["2"], "Notes": ["keep"]})
+
+        with pd.option_context("mode.copy_on_write", True):
+            result = DataPreprocessor.standardize_column_types(df)
+            result.loc[0, "Notes"] = "changed"
+
+        assert df.loc[0, "AbsenceType"] == " Sick "
+        assert df.loc[0, "Extra"] == "2"
+        assert df.loc[0, "Notes"] == "keep"
+
+    def test_categorical_columns(self):
+        """Test that absence and business unit names become categoricals."""
+        df = pd.DataFrame(
+            {"AbsenceName": ["Annual Leave", " annual leave", None], "BusinessUnitName": "Unit A"}
+        )
+
+        result = DataPreprocessor.standardize_column_types(df)
+
+        assert isinstance(result["AbsenceName"].dtype, pd.CategoricalDtype)
+        assert result["AbsenceName"].cat.categories.tolist() == ["", "annual leave"]
+        assert result["BusinessUnitName"].cat.categories.tolist() == ["Unit A"]
+
+    def test_coerces_numeric_and_date_columns(self):
+        """Test numeric and date coercion with invalid values."""
+        df = pd.DataFrame(
+            {"BalanceIn": ["1.5", "abc", None], "StartDate": ["2024-01-02", None, "not a date"]}
+        )
+
+        result = DataPreprocessor.standardize_column_types(df)
+
+        assert result["BalanceIn"].tolist() == [1.5, 0.0, 0.0]
+        assert result["StartDate"].iloc[0] == pd.Timestamp("2024-01-02")
+        assert result["StartDate"].iloc[1:].isna().all()
+
+    def test_parses_iso_dates_with_and_without_time(self):
+        """Test that plain dates and export timestamps parse in one column."""
+        df = pd.DataFrame(
+            {"StartDate": ["2024-01-02", "2023-08-01 00:00:00", "2023-08-01T08:30:00"]}
+        )
+
+        result = DataPreprocessor.standardize_column_types(df)
+
+        assert result["StartDate"].tolist() == [
+            pd.Timestamp("2024-01-02"),
+            pd.Timestamp("2023-08-01"),
+            pd.Timestamp("2023-08-01 08:30"),
+        ]
+
+
+class TestMergeData:
+    """Test cases for the DataPreprocessor merge methods."""
+
+    def test_merge_workday_with_people(self, sample_workday_data, sample_people_data):
+        """Test left join of people columns onto Workday rows."""
+        workday_df = sample_workday_data.set_index(pd.Index([10, 20, 30]))
+
+        result = DataPreprocessor.merge_workday_with_people(workday_df, sample_people_data.iloc[:2])
+
+        assert result.index.tolist() == [0, 1, 2]
+        assert result["Latest Headcount Hire Date"].tolist()[:2] == ["2020-01-15", "2019-06-01"]
+        assert pd.isna(result["Latest Headcount Hire Date"].iloc[2])
+        assert result["MappedEmploymentNumber"].tolist() == ["12345", "67890", "11111"]
+
+    def test_merge_calabrio_with_duplicate_person_keys(self, sample_calabrio_data):
+        """Test that duplicate person keys repeat rows, as pd.merge does."""
+        person_df = pd.DataFrame(
+            {
+                "EmploymentNumber": ["12345", "12345", "67890"],
+                "PersonId": ["P1", "P1b", "P2"],
+                "BusinessUnitName": ["Unit A", "Unit A", "Unit C"],
+            }
+        )
+
+        result = DataPreprocessor.merge_calabrio_with_person(sample_calabrio_data, person_df)
+
+        assert result["EmploymentNumber"].tolist() == ["12345", "12345", "67890", "22222"]
+        assert result["PersonId_person"].tolist()[:3] == ["P1", "P1b", "P2"]
+        assert result["BusinessUnitName_person"].tolist()[2] == "Unit C"
+
+    def test_merge_joins_int_and_string_keys(self, sample_calabrio_data):
+        """Test that Int64 keys on one side match string keys on the other."""
+        calabrio_df = sample_calabrio_data.assign(
+            EmploymentNumber=sample_calabrio_data["EmploymentNumber"].astype("Int64")
+        )
+        person_df = pd.DataFrame({"EmploymentNumber": ["12345", ""], "PersonId": ["P1", "P0"]})
+
+        result = DataPreprocessor.merge_calabrio_with_person(calabrio_df, person_df)
+
+        assert result["EmploymentNumber"].tolist() == ["12345", "67890", "22222"]
+        assert result["PersonId_person"].iloc[0] == "P1"
+        assert result["PersonId_person"].iloc[1:].isna().all()
+
+
+class TestAddAbsenceIds:
+    """Test cases for DataPreprocessor.add_absence_ids."""
+
+    def test_maps_rows_by_business_unit_and_name(self, sample_config_data):
+        """Test lookups per row, including repeated pairs and missing values."""
+        df = pd.DataFrame(
+            {
+                "BusinessUnitName": ["Unit A", "Unit B", "Unit A", None, "Unit Z"],
+                "AbsenceName": ["Annual Leave", "sick leave", "Annual Leave", "Sick Leave", "x"],
+            }
+        )
+
+        result = DataPreprocessor.add_absence_ids(df, sample_config_data)
+
+        assert result["AbsenceId"].tolist() == ["ABS001", "ABS004", "ABS001", None, None]
+        assert "AbsenceId" not in df.columns
+
+    def test_missing_columns(self, sample_config_data):
+        """Test that missing key columns raise ValidationError."""
+        with pytest.raises(ValidationError):
+            DataPreprocessor.add_absence_ids(
+                pd.DataFrame({"AbsenceName": ["Annual Leave"]}), sample_config_data
+            )